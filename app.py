@@ -9,6 +9,7 @@ Entry point for Win Log Interpreter (Gemini-only)
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from src.main.config import load_config
 from src.main.logger import setup_logging, logger
 from src.api.api_client_gemini import GeminiClient
@@ -40,20 +41,22 @@ def run_headless(gemini_client, input_path=None):
     else:
         events = ["Demo event: System reboot", "Demo event: Service failure"]
 
-    analysis = analyze(events)
-    print("=== Local Analysis ===")
-    print(analysis)
-
-    # Ask Gemini about the first event
-    if events:
-        prompt = f"Explain this Windows event for an analyst:\n\n{events[0]}"
-        try:
-            reply = gemini_client.chat(prompt)
-            explanation = get_explanation(gemini_client, events[0], context=None, retries=1)
-            print("\n--- AI Explanation ---\n", explanation)
-        except Exception as exc:
-            logger.exception("Gemini API call failed: %s", exc)
-            print("Failed to get explanation from Gemini:", exc)
+    # Ask Gemini about the first event in the background so the network
+    # round trip overlaps with the local (CPU-bound) analysis
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(get_explanation, gemini_client, events[0], context=None, retries=1) if events else None
+
+        analysis = analyze(events)
+        print("=== Local Analysis ===")
+        print(analysis)
+
+        if pending is not None:
+            try:
+                explanation = pending.result()
+                print("\n--- AI Explanation ---\n", explanation)
+            except Exception as exc:
+                logger.exception("Gemini API call failed: %s", exc)
+                print("Failed to get explanation from Gemini:", exc)
 
 
 def main(argv=None):
@@ -14,14 +14,73 @@ Public functions:
 - build_explain_prompt(event: str, context: dict|None = None) -> str
 - parse_gemini_response(resp: Any) -> str
 - get_explanation(gemini_client, event: str, context: dict|None = None, retries: int = 1) -> str
+- get_explanations(gemini_client, events: list[str], context: dict|None = None, retries: int = 1) -> list[str]
+- get_cached_explanation(gemini_client, event: str, context: dict|None = None) -> str|None
+- clear_explanation_cache() -> None
 """
 
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
+import hashlib
+import threading
 import time
 
 from src.main.logger import logger
 
 
+# In-memory LRU of cleaned explanations keyed on (base_url, model, prompt digest),
+# so repeated events (service restarts, failed logons...) skip the Gemini round trip.
+# Kept in memory only: explanations quote raw log content and are not written to disk.
+_CACHE_MAXSIZE = 4096
+_explanation_cache: "OrderedDict[Tuple[Any, Any, str], str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _prompt_digest(prompt: str) -> str:
+    return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_key(gemini_client, prompt: str) -> Tuple[Any, Any, str]:
+    # Key on the endpoint and model rather than the client object, so a client
+    # replaced in Settings (and its session/sockets) is not kept alive by the cache
+    return (
+        getattr(gemini_client, "base_url", None),
+        getattr(gemini_client, "model", None),
+        _prompt_digest(prompt),
+    )
+
+
+def _cache_get(cache_key: Tuple[Any, Any, str]) -> Optional[str]:
+    with _cache_lock:
+        cached = _explanation_cache.get(cache_key)
+        if cached is not None:
+            _explanation_cache.move_to_end(cache_key)
+        return cached
+
+
+def clear_explanation_cache() -> None:
+    """Drop every cached explanation."""
+    with _cache_lock:
+        _explanation_cache.clear()
+
+
+# Static analyst instructions. Every prompt starts with this exact prefix so
+# Gemini's implicit context caching can reuse it across requests.
+_PROMPT_HEADER = "\n".join([
+    "You are an experienced Windows systems analyst. Explain the event below",
+    "in clear, concise language suitable for another analyst. Include:",
+    "- What the event likely means",
+    "- Possible causes",
+    "- Immediate triage steps (what to check first)",
+    "- Indicators of compromise or false positives (if applicable)",
+    "- Short summary (1-2 sentences)",
+    "",
+    "Event:",
+])
+_PROMPT_FOOTER = "Provide the explanation in sections with headings. Keep it concise."
+
+
 def build_explain_prompt(event: str, context: Optional[Dict[str, Any]] = None) -> str:
     """
     Build a concise, structured prompt for Gemini to explain a Windows event.
@@ -33,33 +92,20 @@ def build_explain_prompt(event: str, context: Optional[Dict[str, Any]] = None) -
     Returns:
         Prompt string.
     """
-    lines = [
-        "You are an experienced Windows systems analyst. Explain the event below",
-        "in clear, concise language suitable for another analyst. Include:",
-        "- What the event likely means",
-        "- Possible causes",
-        "- Immediate triage steps (what to check first)",
-        "- Indicators of compromise or false positives (if applicable)",
-        "- Short summary (1-2 sentences)",
-        "",
-        "Event:",
-        event,
-        "",
-    ]
-
-    if context:
-        lines.append("Context:")
-        for k, v in context.items():
-            if k == "related_events" and isinstance(v, list):
-                lines.append(f"- related_events: {len(v)} items (top 3 shown)")
-                for idx, it in enumerate(v[:3], 1):
-                    lines.append(f"  {idx}. {it}")
-            else:
-                lines.append(f"- {k}: {v}")
-        lines.append("")
-
-    lines.append("Provide the explanation in sections with headings. Keep it concise.")
-    return "\n".join(lines)
+    if not context:
+        return f"{_PROMPT_HEADER}\n{event}\n\n{_PROMPT_FOOTER}"
+
+    lines = ["Context:"]
+    for k, v in context.items():
+        if k == "related_events" and isinstance(v, list):
+            lines.append(f"- related_events: {len(v)} items (top 3 shown)")
+            for idx, it in enumerate(v[:3], 1):
+                lines.append(f"  {idx}. {it}")
+        else:
+            lines.append(f"- {k}: {v}")
+
+    context_block = "\n".join(lines)
+    return f"{_PROMPT_HEADER}\n{event}\n\n{context_block}\n\n{_PROMPT_FOOTER}"
 
 
 def parse_gemini_response(resp: Any) -> str:
@@ -89,6 +135,15 @@ def parse_gemini_response(resp: Any) -> str:
 
     # If it's a dict, try common locations
     if isinstance(resp, dict):
+        # Fast path: the canonical generateContent shape, read with plain
+        # indexing before falling back to the tolerant walk below
+        try:
+            text = resp["candidates"][0]["content"]["parts"][0]["text"]
+        except (KeyError, IndexError, TypeError):
+            text = None
+        if isinstance(text, str):
+            return text.strip()
+
         # common google/generative response shape handled by client already,
         # but we keep this tolerant for other providers:
         # - candidates -> content -> parts -> text
@@ -152,6 +207,7 @@ def get_explanation(
     context: Optional[Dict[str, Any]] = None,
     retries: int = 1,
     backoff_seconds: float = 1.0,
+    use_cache: bool = True,
 ) -> str:
     """
     Build a prompt, call Gemini, and return a cleaned explanation string.
@@ -162,6 +218,7 @@ def get_explanation(
         context: Optional context dict
         retries: number of retries on transient errors
         backoff_seconds: base sleep for exponential backoff
+        use_cache: serve/store the result in the in-memory explanation cache
 
     Returns:
         Cleaned explanation string.
@@ -170,6 +227,14 @@ def get_explanation(
         Propagates exceptions from the client after retries are exhausted.
     """
     prompt = build_explain_prompt(event, context)
+
+    cache_key = _cache_key(gemini_client, prompt) if use_cache else None
+    if cache_key is not None:
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            logger.debug("Explanation served from cache")
+            return cached
+
     attempt = 0
     last_exc = None
 
@@ -179,8 +244,14 @@ def get_explanation(
             resp = gemini_client.chat(prompt)
             explanation = parse_gemini_response(resp)
             # Clean / normalize whitespace & remove excessive blank lines
-            lines = [line.rstrip() for line in explanation.strip().splitlines() if line.strip()]
-            return "\n".join(lines)
+            # (rstrip each line once; whitespace-only lines become "" and are dropped)
+            cleaned = "\n".join(filter(None, map(str.rstrip, explanation.strip().splitlines())))
+            if cache_key is not None:
+                with _cache_lock:
+                    _explanation_cache[cache_key] = cleaned
+                    if len(_explanation_cache) > _CACHE_MAXSIZE:
+                        _explanation_cache.popitem(last=False)
+            return cleaned
         except Exception as exc:
             last_exc = exc
             logger.warning("Failed to get explanation (attempt %d): %s", attempt + 1, exc)
@@ -194,3 +265,53 @@ def get_explanation(
     logger.exception("All attempts to get explanation failed. Last error: %s", last_exc)
     # Re-raise the last exception so callers (UI) can show meaningful messages
     raise last_exc
+
+
+def get_cached_explanation(
+    gemini_client,
+    event: str,
+    context: Optional[Dict[str, Any]] = None,
+) -> Optional[str]:
+    """
+    Return the cached explanation get_explanation would serve for these
+    arguments, or None if there is none. Never calls Gemini, so UI code can
+    use it to show repeats immediately instead of going through a worker.
+    """
+    return _cache_get(_cache_key(gemini_client, build_explain_prompt(event, context)))
+
+
+def get_explanations(
+    gemini_client,
+    events: List[str],
+    context: Optional[Dict[str, Any]] = None,
+    retries: int = 1,
+    max_workers: int = 8,
+) -> List[str]:
+    """
+    Explain several events concurrently.
+
+    Each distinct event is sent once through get_explanation (with its retries
+    and cache) on a small thread pool, so request latencies overlap instead of
+    adding up. Results are returned in the same order as `events`.
+
+    Workers are capped at the client's `max_connections` (as in
+    GeminiClient.chat_batch), so every in-flight request reuses a pooled
+    keep-alive connection instead of one urllib3 discards afterwards.
+
+    Raises:
+        The first exception raised by any get_explanation call.
+    """
+    unique = list(dict.fromkeys(events))
+    if not unique:
+        return []
+
+    def _explain(ev: str) -> str:
+        return get_explanation(gemini_client, ev, context=context, retries=retries)
+
+    workers = min(max_workers, len(unique))
+    pool_size = getattr(gemini_client, "max_connections", None)
+    if isinstance(pool_size, int):
+        workers = min(workers, pool_size)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        explained = dict(zip(unique, pool.map(_explain, unique)))
+    return [explained[ev] for ev in events]
@@ -5,13 +5,26 @@ Google Gemini API Client (Official REST Format)
 
 import os
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
 import requests
+from requests.adapters import HTTPAdapter
 from src.main.constants import (
     GEMINI_DEFAULT_BASE_URL,
     GEMINI_DEFAULT_MODEL,
     GEMINI_API_VERSION,
 )
 from src.main.logger import logger
+from src.utils.helpers import json_loads
+
+
+# generateContent body is always {"contents":[{"parts":[{"text": <prompt>}]}]};
+# only the prompt varies, so the rest is kept as pre-encoded bytes
+_PAYLOAD_PREFIX = b'{"contents":[{"parts":[{"text":'
+_PAYLOAD_SUFFIX = b'}]}]}'
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class GeminiAPIError(Exception):
@@ -19,7 +32,13 @@ class GeminiAPIError(Exception):
 
 
 class GeminiClient:
-    def __init__(self, api_key: str = None, base_url: str = None, timeout: int = 20):
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: str = None,
+        timeout: int = 20,
+        max_connections: int = 16,
+    ):
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key missing")
@@ -28,24 +47,34 @@ class GeminiClient:
         self.model = GEMINI_DEFAULT_MODEL
         self.api_version = GEMINI_API_VERSION
         self.timeout = timeout
+        self.max_connections = max(1, int(max_connections))
+
+        # Endpoint never changes for the lifetime of the client; build it once
+        # (_endpoint is the key-free form used in log messages)
+        self._endpoint = f"{self.base_url}/{self.api_version}/{self.model}:generateContent"
+        self._url = f"{self._endpoint}?key={self.api_key}"
+
+        # Shared session: keeps TCP/TLS connections alive across requests
+        # (including the worker threads used by chat_batch). Every request
+        # goes to one host, so only the per-host pool size matters.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_connections)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     # --------------------------
     # Internal request method
     # --------------------------
-    def _generate_url(self):
-        return (
-            f"{self.base_url}/{self.api_version}/{self.model}:generateContent"
-            f"?key={self.api_key}"
-        )
-
-    def _post(self, payload: dict):
-        url = self._generate_url()
+    def _post(self, body: bytes):
+        url = self._url
 
         try:
-            logger.debug("POST %s | Payload: %s", url, payload)
+            # Never log the prompt itself (raw event text) or the key-bearing URL
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("POST %s | body bytes: %d", self._endpoint, len(body))
 
-            response = requests.post(
-                url, json=payload, timeout=self.timeout
+            response = self._session.post(
+                url, data=body, headers=_JSON_HEADERS, timeout=self.timeout
             )
 
         except Exception as exc:
@@ -59,7 +88,7 @@ class GeminiClient:
             )
 
         try:
-            return response.json()
+            return json_loads(response.content)
         except Exception:
             raise GeminiAPIError("Invalid JSON response")
 
@@ -72,15 +101,11 @@ class GeminiClient:
         Returns a string response.
         """
 
-        payload = {
-            "contents": [
-                {
-                    "parts": [{"text": prompt}]
-                }
-            ]
-        }
+        # Only the prompt needs encoding; json.dumps escapes it (ASCII-only)
+        # and supplies the surrounding quotes
+        body = _PAYLOAD_PREFIX + json.dumps(prompt).encode("ascii") + _PAYLOAD_SUFFIX
 
-        data = self._post(payload)
+        data = self._post(body)
 
         try:
             # Gemini returns text in:
@@ -88,3 +113,21 @@ class GeminiClient:
             return data["candidates"][0]["content"]["parts"][0]["text"]
         except Exception:
             raise GeminiAPIError("Unexpected Gemini response format")
+
+    def chat_batch(self, prompts: List[str], max_workers: int = 8) -> List[str]:
+        """
+        Sends several prompts concurrently over the shared session.
+        Returns the responses in the same order as `prompts`; the first
+        failure is raised.
+
+        Workers are capped at `max_connections` so every in-flight request
+        reuses a pooled keep-alive connection instead of opening (and then
+        discarding) an extra TLS connection.
+        """
+        prompts = list(prompts)
+        if not prompts:
+            return []
+
+        workers = min(max_workers, self.max_connections, len(prompts))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.chat, prompts))
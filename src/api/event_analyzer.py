@@ -10,30 +10,161 @@ This module performs *non-AI* analysis of Windows event logs to:
 - prepare context for AI explanation
 
 Public functions:
-- analyze(events: list[str]) -> dict
+- analyze(events: Iterable[str]) -> dict
 - analyze_single(event: str) -> dict
 - detect_patterns(event: str) -> dict
 """
 
 import re
-from typing import List, Dict, Any
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable, Dict, Any
 from src.main.logger import logger
 
 
+# -----------------------------------------
+# Keyword tables (compiled once at import)
+# -----------------------------------------
+_SEVERITY_KEYWORDS = {
+    "critical": frozenset({"critical", "fatal", "panic", "crash", "bsod"}),
+    "error": frozenset({"error", "failed", "failure", "denied", "timeout"}),
+    "warning": frozenset({"warning", "slow", "degraded", "retrying"}),
+}
+# Highest severity first; anything without a hit is "info"
+_SEVERITY_ORDER = tuple(_SEVERITY_KEYWORDS)
+
+# Reported severity buckets, in summary order
+_SEVERITY_LEVELS = ("info", "warning", "error", "critical")
+
+_PATTERN_KEYWORDS = {
+    "authentication_issue": frozenset({"login", "logon", "credential", "password", "auth"}),
+    "network_issue": frozenset({"timeout", "connection", "network", "dns", "tcp", "port"}),
+    "service_issue": frozenset({"service", "daemon", "stopped", "restart", "crashed"}),
+    "filesystem_issue": frozenset({"disk", "io", "file", "path", "read", "write", "permission"}),
+    "security_flag": frozenset({"virus", "malware", "ransom", "attack", "threat"}),
+    "kernel_issue": frozenset({"kernel", "driver", "ntoskrnl", "memory", "bsod"}),
+}
+_PATTERN_NAMES = tuple(_PATTERN_KEYWORDS)
+
+# Recommended focus area for each pattern, in report order
+_FOCUS_AREAS = {
+    "authentication_issue": "authentication",
+    "network_issue": "network",
+    "service_issue": "services",
+    "filesystem_issue": "filesystem",
+    "security_flag": "security",
+    "kernel_issue": "kernel/drivers",
+}
+
+
+def _build_keyword_categories() -> Dict[str, frozenset]:
+    """
+    Map every keyword to the categories (severity levels and pattern names)
+    it signals. A keyword also inherits the categories of any shorter keyword
+    it starts with ("crashed" -> service_issue + critical via "crash"), since
+    only the longest keyword is reported at a given offset.
+    """
+    direct: Dict[str, set] = {}
+    for table in (_SEVERITY_KEYWORDS, _PATTERN_KEYWORDS):
+        for category, words in table.items():
+            for w in words:
+                direct.setdefault(w, set()).add(category)
+
+    return {
+        kw: frozenset().union(*(cats for k, cats in direct.items() if kw.startswith(k)))
+        for kw in direct
+    }
+
+
+def _trie_pattern(words) -> str:
+    """
+    Compile keywords into a trie-shaped alternation, e.g. "crash(?:ed)?",
+    so the regex engine rejects most offsets after a single character
+    comparison. Optional tails are greedy, so the longest keyword wins.
+    """
+    trie: Dict[str, dict] = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-keyword marker
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) > 1:
+            return "(?:" + "|".join(branches) + ")"
+        return branches[0]
+
+    return emit(trie)
+
+
+_KEYWORD_CATEGORIES = _build_keyword_categories()
+
+# Single multi-keyword matcher over lowercased text. The lookahead lets the
+# scan try every offset so overlapping hits (e.g. "io" inside "connection")
+# are still reported.
+_KEYWORD_RE = re.compile("(?=(" + _trie_pattern(_KEYWORD_CATEGORIES) + "))")
+
+# Per-level matchers for classify_severity(): tried in priority order and
+# stopping at the first hit, without looking for pattern keywords at all
+_SEVERITY_RES = tuple(
+    (level, re.compile(_trie_pattern(words))) for level, words in _SEVERITY_KEYWORDS.items()
+)
+
+
+def _scan_keywords(text: str) -> frozenset:
+    """Return every severity level / pattern name hit in one pass over `text` (lowercased)."""
+    hits = set()
+    for m in _KEYWORD_RE.finditer(text):
+        hits.update(_KEYWORD_CATEGORIES[m.group(1)])
+    return frozenset(hits)
+
+
+@lru_cache(maxsize=None)
+def _hit_profile(hits: frozenset) -> tuple:
+    """
+    Derive (severity, matches, match_count, recommended_focus) for one
+    combination of hits. There are at most 2**9 combinations, so each is
+    computed once and shared; callers copy the mutable parts.
+    """
+    severity = "info"
+    for level in _SEVERITY_ORDER:
+        if level in hits:
+            severity = level
+            break
+
+    matches = {name: name in hits for name in _PATTERN_NAMES}
+
+    # Count matches
+    match_count = sum(1 for v in matches.values() if v)
+
+    # Recommended focus areas based on patterns matched
+    focus = tuple(area for name, area in _FOCUS_AREAS.items() if name in hits)
+
+    return severity, matches, match_count, focus
+
+
+def _patterns_from_hits(hits: frozenset) -> Dict[str, Any]:
+    _, matches, match_count, _ = _hit_profile(hits)
+    return {
+        "matches": dict(matches),
+        "match_count": match_count,
+    }
+
+
 # -----------------------------------------
 # Utility: classify severity based on text
 # -----------------------------------------
 def classify_severity(event: str) -> str:
     text = event.lower()
 
-    if any(w in text for w in ("critical", "fatal", "panic", "crash", "bsod")):
-        return "critical"
-
-    if any(w in text for w in ("error", "failed", "failure", "denied", "timeout")):
-        return "error"
-
-    if any(w in text for w in ("warning", "slow", "degraded", "retrying")):
-        return "warning"
+    for level, pattern in _SEVERITY_RES:
+        if pattern.search(text):
+            return level
 
     return "info"
 
@@ -44,25 +175,9 @@ def classify_severity(event: str) -> str:
 def detect_patterns(event: str) -> Dict[str, Any]:
     """
     Pattern detection based on keywords or regex.
-    Expand this dictionary as you want to cover more event types.
+    Expand _PATTERN_KEYWORDS as you want to cover more event types.
     """
-
-    patterns = {
-        "authentication_issue": bool(re.search(r"(login|logon|credential|password|auth)", event, re.I)),
-        "network_issue": bool(re.search(r"(timeout|connection|network|dns|tcp|port)", event, re.I)),
-        "service_issue": bool(re.search(r"(service|daemon|stopped|restart|crashed)", event, re.I)),
-        "filesystem_issue": bool(re.search(r"(disk|io|file|path|read|write|permission)", event, re.I)),
-        "security_flag": bool(re.search(r"(virus|malware|ransom|attack|threat)", event, re.I)),
-        "kernel_issue": bool(re.search(r"(kernel|driver|ntoskrnl|memory|bsod)", event, re.I)),
-    }
-
-    # Count matches
-    match_count = sum(1 for v in patterns.values() if v)
-
-    return {
-        "matches": patterns,
-        "match_count": match_count,
-    }
+    return _patterns_from_hits(_scan_keywords(event.lower()))
 
 
 # -----------------------------------------
@@ -80,39 +195,32 @@ def analyze_single(event: str) -> dict:
     if not isinstance(event, str):
         event = str(event)
 
-    severity = classify_severity(event)
-    patterns = detect_patterns(event)
+    # One keyword scan yields both the severity and the pattern flags
+    return _analysis_from_hits(event, _scan_keywords(event.lower()))
 
-    # Recommended focus areas based on patterns matched
-    recommended_focus = []
-    if patterns["matches"]["authentication_issue"]:
-        recommended_focus.append("authentication")
-    if patterns["matches"]["network_issue"]:
-        recommended_focus.append("network")
-    if patterns["matches"]["service_issue"]:
-        recommended_focus.append("services")
-    if patterns["matches"]["filesystem_issue"]:
-        recommended_focus.append("filesystem")
-    if patterns["matches"]["security_flag"]:
-        recommended_focus.append("security")
-    if patterns["matches"]["kernel_issue"]:
-        recommended_focus.append("kernel/drivers")
+
+def _analysis_from_hits(event: str, hits: frozenset) -> dict:
+    """Build the analyze_single() result for `event` from its keyword hits."""
+    severity, matches, match_count, focus = _hit_profile(hits)
 
     return {
         "event": event,
         "severity": severity,
-        "patterns": patterns,
-        "recommended_focus": recommended_focus,
+        "patterns": {"matches": dict(matches), "match_count": match_count},
+        "recommended_focus": list(focus),
     }
 
 
 # -----------------------------------------
 # Analyze a list of events
 # -----------------------------------------
-def analyze(events: List[str]) -> dict:
+def analyze(events: Iterable[str]) -> dict:
     """
     High-level batch analysis.
 
+    `events` may be any iterable (e.g. a generator streaming out of the
+    parser); it is consumed exactly once.
+
     Returns:
         {
             "total_events": int,
@@ -122,33 +230,36 @@ def analyze(events: List[str]) -> dict:
         }
     """
 
-    logger.info("Analyzing %d events (local analysis)", len(events))
-
-    results = []
-    severities = {"info": 0, "warning": 0, "error": 0, "critical": 0}
-    pattern_counts = {
-        "authentication_issue": 0,
-        "network_issue": 0,
-        "service_issue": 0,
-        "filesystem_issue": 0,
-        "security_flag": 0,
-        "kernel_issue": 0,
-    }
+    severities = dict.fromkeys(_SEVERITY_LEVELS, 0)
+    pattern_counts = dict.fromkeys(_PATTERN_NAMES, 0)
+
+    # Scan each distinct event text once (Windows logs repeat the same
+    # messages a lot), then aggregate counts weighted by multiplicity.
+    texts = [ev if isinstance(ev, str) else str(ev) for ev in events]
+    logger.info("Analyzing %d events (local analysis)", len(texts))
+    multiplicity = Counter(texts)
+    hits_by_text = {text: _scan_keywords(text.lower()) for text in multiplicity}
+
+    results = [_analysis_from_hits(text, hits_by_text[text]) for text in texts]
+
+    # Aggregate per distinct hit combination rather than per event
+    profile_counts = Counter()
+    for text, count in multiplicity.items():
+        profile_counts[hits_by_text[text]] += count
 
-    for ev in events:
-        analysis = analyze_single(ev)
-        results.append(analysis)
+    for hits, count in profile_counts.items():
+        severity, matches, _, _ = _hit_profile(hits)
 
         # Count severity
-        severities[analysis["severity"]] += 1
+        severities[severity] += count
 
         # Count patterns
-        for pname, matched in analysis["patterns"]["matches"].items():
+        for pname, matched in matches.items():
             if matched:
-                pattern_counts[pname] += 1
+                pattern_counts[pname] += count
 
     return {
-        "total_events": len(events),
+        "total_events": len(texts),
         "severities": severities,
         "pattern_counts": pattern_counts,
         "events": results,
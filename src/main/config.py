@@ -16,9 +16,14 @@ Files:
 """
 
 import os
+import copy
 import json
+import stat
+import tempfile
 from pathlib import Path
 
+from src.utils.helpers import json_loads
+
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 CONFIG_DIR = BASE_DIR / "config"
 
@@ -31,12 +36,27 @@ def _load_json_file(path, fallback=None):
     if not path.exists():
         return fallback or {}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return json_loads(path.read_bytes())
     except Exception:
         return fallback or {}
 
 
+# Merged JSON layers, cached as (files_key, settings) and reused while the
+# settings files' (mtime, size) stay the same
+_file_settings_cache = None
+
+
+def _settings_files_key():
+    key = []
+    for path in (DEFAULT_SETTINGS_FILE, APP_SETTINGS_FILE):
+        try:
+            st = path.stat()
+            key.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
+
 def load_config():
     """
     Load settings from:
@@ -45,16 +65,28 @@ def load_config():
     3. Environment variables
 
     Environment values override JSON values.
+    The JSON layers are only re-read when one of the files changes; callers
+    always get their own copy and may modify it freely.
     """
-    config = {}
+    global _file_settings_cache
+
+    key = _settings_files_key()
+    cached = _file_settings_cache
+    if cached is None or cached[0] != key:
+        settings = {}
 
-    # --- Layer 1: Load defaults ---
-    defaults = _load_json_file(DEFAULT_SETTINGS_FILE, {})
-    config.update(defaults)
+        # --- Layer 1: Load defaults ---
+        defaults = _load_json_file(DEFAULT_SETTINGS_FILE, {})
+        settings.update(defaults)
 
-    # --- Layer 2: Load user app settings ---
-    app_settings = _load_json_file(APP_SETTINGS_FILE, {})
-    config.update(app_settings)
+        # --- Layer 2: Load user app settings ---
+        app_settings = _load_json_file(APP_SETTINGS_FILE, {})
+        settings.update(app_settings)
+
+        cached = (key, settings)
+        _file_settings_cache = cached
+
+    config = copy.deepcopy(cached[1])
 
     # --- Layer 3: Load environment variables ---
     gemini_key = os.getenv("GEMINI_API_KEY")
@@ -64,14 +96,42 @@ def load_config():
     return config
 
 
+def _settings_file_mode() -> int:
+    """Permissions for the rewritten settings file: the current file's, else the umask default."""
+    try:
+        return stat.S_IMODE(APP_SETTINGS_FILE.stat().st_mode)
+    except OSError:
+        # First save: what open() would have created (umask can only be read by setting it)
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
 def save_app_settings(settings: dict):
     """Save settings to app_settings.json."""
+    global _file_settings_cache
+
+    tmp_path = None
     try:
-        with open(APP_SETTINGS_FILE, "w", encoding="utf-8") as f:
+        # Write a temp file next to it and swap it in, so readers (settings
+        # may be saved from a worker thread) never see a half-written file
+        fd, tmp_path = tempfile.mkstemp(dir=CONFIG_DIR, prefix="app_settings.", suffix=".tmp")
+        with open(fd, "w", encoding="utf-8") as f:
             json.dump(settings, f, indent=4)
+        # mkstemp creates the file 0600; keep the permissions the file had
+        os.chmod(tmp_path, _settings_file_mode())
+        os.replace(tmp_path, APP_SETTINGS_FILE)
         return True
     except Exception:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
         return False
+    finally:
+        # Coarse mtime resolution could hide a same-size rewrite; always re-read next time
+        _file_settings_cache = None
 
 
 if __name__ == "__main__":
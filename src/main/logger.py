@@ -14,26 +14,30 @@ import sys
 LOGGER_NAME = "win-log-interpreter"
 logger = logging.getLogger(LOGGER_NAME)
 
+# Formatter shared by every setup_logging() call
+_FORMATTER = logging.Formatter(
+    "[%(asctime)s] [%(levelname)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Console handler, created on first setup_logging() call and reused after
+_HANDLER = None
 
-def setup_logging(debug: bool = False):
-    """Configure application logging."""
-    logger.setLevel(logging.DEBUG if debug else logging.INFO)
 
-    # Formatter
-    formatter = logging.Formatter(
-        "[%(asctime)s] [%(levelname)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+def setup_logging(debug: bool = False):
+    """Configure application logging. Safe to call more than once."""
+    global _HANDLER
 
-    # Console Handler
-    ch = logging.StreamHandler(sys.stdout)
-    ch.setFormatter(formatter)
-    ch.setLevel(logging.DEBUG if debug else logging.INFO)
+    level = logging.DEBUG if debug else logging.INFO
+    logger.setLevel(level)
 
-    # Clear existing handlers to avoid duplicate logs
-    if logger.hasHandlers():
-        logger.handlers.clear()
+    if _HANDLER is None:
+        _HANDLER = logging.StreamHandler(sys.stdout)
+        _HANDLER.setFormatter(_FORMATTER)
+    _HANDLER.setLevel(level)
 
-    logger.addHandler(ch)
+    # Attach only once to avoid duplicate logs
+    if _HANDLER not in logger.handlers:
+        logger.addHandler(_HANDLER)
 
     logger.debug("Logging initialized (debug mode: %s)", debug)
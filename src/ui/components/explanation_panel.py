@@ -14,6 +14,9 @@ Public methods:
 Designed to be embedded in the main UI.
 """
 
+import bisect
+import os
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
@@ -21,6 +24,19 @@ from typing import Optional
 
 from src.main.logger import logger
 
+_END = "end"
+
+# Write buffer for saved explanations and the poll interval (ms) used to
+# wait for the background save on the Tk thread
+_SAVE_BUFFER = 1 << 20
+_SAVE_POLL_MS = 50
+
+# How long (ms) a success message stays in the header
+_TOAST_MS = 1500
+
+# Typing pause (ms) before the search entry runs an incremental search
+_SEARCH_DEBOUNCE_MS = 150
+
 
 class ExplanationPanel(ttk.Frame):
     def __init__(self, master=None, height: int = 20, **kwargs):
@@ -32,6 +48,10 @@ class ExplanationPanel(ttk.Frame):
 
         ttk.Label(header, text="AI Explanation", font=("Arial", 11, "bold")).pack(side=tk.LEFT)
 
+        # Non-modal success message next to the title (hidden until used)
+        self._toast = ttk.Label(header, text="", foreground="#2E7D32")
+        self._toast_after_id = None
+
         btns = ttk.Frame(header)
         btns.pack(side=tk.RIGHT)
 
@@ -46,35 +66,87 @@ class ExplanationPanel(ttk.Frame):
         self._search_var = tk.StringVar()
         search_entry = ttk.Entry(search_frame, textvariable=self._search_var)
         search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        # Search as you type, once typing pauses
+        self._search_after_id = None
+        search_entry.bind("<KeyRelease>", self._schedule_find)
         ttk.Button(search_frame, text="Find", command=self.find_next).pack(side=tk.LEFT, padx=4)
 
         # Text area
         self.text = ScrolledText(self, wrap=tk.WORD, height=height)
         self.text.pack(fill=tk.BOTH, expand=True)
+        # Hook view changes (scroll, resize, edits) to highlight search
+        # matches as they come into view
+        self.text.configure(yscrollcommand=self._on_yscroll)
         # configure default tags
         self.text.tag_configure("highlight", background="#FFF59D")  # light yellow highlight
+        self.text.tag_configure("current_match", background="#FFB74D")  # orange: match at the cursor
+
+        # Search state: every match of the last term is found once and reused
+        # while the term and the text stay the same. _text_version changes on
+        # every edit (programmatic or typed), so a cache hit never has to
+        # read the text back out of the widget.
+        self._count_var = tk.Variable(self)
+        self._search_cache = {"key": None, "matches": [], "starts": [], "tagged": (0, 0)}
+        self._text_version = 0
+        self._text_cache = (None, "")  # (version, get_text() result)
+        self.text.bind("<<Modified>>", self._on_text_modified)
+
+        # append_text() bursts (e.g. streamed output) are buffered and
+        # inserted with a single Tcl call once the event loop goes idle
+        self._append_buf = []
+        self._append_after_id = None
 
     # ----------------------
     # Public API
     # ----------------------
     def set_text(self, text: str):
         """Replace content with `text` and move view to top."""
-        self.text.delete(1.0, tk.END)
-        self.text.insert(tk.END, text or "")
+        self._discard_appends()
+        self._text_version += 1
+        self.text.replace("1.0", _END, text or "")
         self.text.mark_set(tk.INSERT, "1.0")
         self.text.see("1.0")
 
     def append_text(self, text: str):
-        """Append additional text."""
-        self.text.insert(tk.END, text or "")
+        """Append additional text (shown on the next idle cycle)."""
+        if not text:
+            return
+        self._append_buf.append(text)
+        if self._append_after_id is None:
+            self._append_after_id = self.after_idle(self._flush_appends)
 
     def clear(self):
         """Clear the explanation area."""
-        self.text.delete(1.0, tk.END)
+        self._discard_appends()
+        self._text_version += 1
+        self.text.delete(1.0, _END)
 
     def get_text(self) -> str:
         """Return the current content as a string."""
-        return self.text.get(1.0, tk.END).rstrip("\n")
+        self._flush_appends()
+        version, content = self._text_cache
+        if version != self._text_version:
+            # "end-1c" leaves out the newline Tk always keeps at the end, so
+            # rstrip() only copies when the content itself ends in newlines
+            content = self.text.get("1.0", "end-1c").rstrip("\n")
+            self._text_cache = (self._text_version, content)
+        return content
+
+    def _flush_appends(self):
+        """Insert all buffered append_text() chunks with one Tcl call."""
+        if self._append_after_id is not None:
+            self.after_cancel(self._append_after_id)
+            self._append_after_id = None
+        if self._append_buf:
+            self._text_version += 1
+            self.text.insert(_END, "".join(self._append_buf))
+            self._append_buf.clear()
+
+    def _discard_appends(self):
+        if self._append_after_id is not None:
+            self.after_cancel(self._append_after_id)
+            self._append_after_id = None
+        self._append_buf.clear()
 
     # ----------------------
     # Utilities
@@ -86,9 +158,11 @@ class ExplanationPanel(ttk.Frame):
             messagebox.showinfo("Copy", "Nothing to copy.")
             return
         try:
+            # Tk is not thread-safe, so this stays on the UI thread; one
+            # append of the snapshot, with no idle work run in between
             self.clipboard_clear()
             self.clipboard_append(content)
-            messagebox.showinfo("Copy", "Explanation copied to clipboard.")
+            self._show_toast("Copied to clipboard")
         except Exception as exc:
             logger.exception("Failed to copy to clipboard: %s", exc)
             messagebox.showerror("Copy Error", f"Failed to copy: {exc}")
@@ -107,43 +181,208 @@ class ExplanationPanel(ttk.Frame):
         )
         if not path:
             return
+
+        # Write off the Tk thread; the result is picked up by _finish_save.
+        # Not a daemon thread, so a save in progress completes on exit.
+        result = {}
+        worker = threading.Thread(target=self._write_file, args=(path, content, result))
+        worker.start()
+        self.after(_SAVE_POLL_MS, self._finish_save, worker, path, result)
+
+    @staticmethod
+    def _write_file(path: str, content: str, result: dict):
+        """Runs in the save thread; must not touch any widget."""
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(content)
-            messagebox.showinfo("Save", f"Saved explanation to:\n{path}")
+            # Encode in one go and write bytes, rather than streaming through
+            # TextIOWrapper's incremental encoder. Keep the platform newline
+            # translation that text mode used to do.
+            if os.linesep != "\n":
+                content = content.replace("\n", os.linesep)
+            data = content.encode("utf-8")
+            with open(path, "wb", buffering=_SAVE_BUFFER) as f:
+                f.write(data)
         except Exception as exc:
             logger.exception("Failed to save explanation: %s", exc)
+            result["error"] = exc
+
+    def _finish_save(self, worker: threading.Thread, path: str, result: dict):
+        if worker.is_alive():
+            self.after(_SAVE_POLL_MS, self._finish_save, worker, path, result)
+            return
+
+        exc = result.get("error")
+        if exc is not None:
             messagebox.showerror("Save Error", f"Failed to save file: {exc}")
+        else:
+            self._show_toast(f"Saved to {os.path.basename(path)}")
+
+    def _show_toast(self, message: str):
+        """Show `message` in the header briefly instead of a blocking dialog."""
+        if self._toast_after_id is not None:
+            self.after_cancel(self._toast_after_id)
+        self._toast.config(text=message)
+        self._toast.pack(side=tk.LEFT, padx=10)
+        self._toast_after_id = self.after(_TOAST_MS, self._hide_toast)
+
+    def _hide_toast(self):
+        self._toast_after_id = None
+        self._toast.pack_forget()
 
     # ----------------------
     # Search / Highlight
     # ----------------------
-    def find_next(self):
-        """Find next occurrence of the search term and highlight it."""
+    def _schedule_find(self, event=None):
+        """Debounce keystrokes: only the last one within the delay searches."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(_SEARCH_DEBOUNCE_MS, self._incremental_find)
+
+    def _incremental_find(self):
+        self._search_after_id = None
+        # Re-search from the start of the current match so extending the
+        # term keeps matching at the same place
+        current = self.text.tag_ranges("current_match")
+        if current:
+            self.text.mark_set(tk.INSERT, current[0])
+        self.find_next(quiet=True)
+
+    def find_next(self, quiet: bool = False):
+        """
+        Highlight all occurrences of the search term and move to the next one.
+        With quiet=True (search-as-you-type) no dialogs are shown.
+        """
         term = (self._search_var.get() or "").strip()
         if not term:
-            messagebox.showinfo("Search", "Enter a search term.")
+            if quiet:
+                self._search_cache["key"] = None
+                self.text.tag_remove("highlight", "1.0", _END)
+                self.text.tag_remove("current_match", "1.0", _END)
+            else:
+                messagebox.showinfo("Search", "Enter a search term.")
             return
 
-        start_pos = self.text.index(tk.INSERT)
-        # remove previous highlights
-        self.text.tag_remove("highlight", "1.0", tk.END)
+        self._flush_appends()
+        text = self.text
+        cache = self._search_cache
+        key = (term.lower(), self._text_version)
 
-        idx = self.text.search(term, start_pos, nocase=True, stopindex=tk.END)
-        if not idx:
-            # try from top
-            idx = self.text.search(term, "1.0", nocase=True, stopindex=start_pos)
+        if cache["key"] != key:
+            matches = self._find_all(term, self.get_text())
+            # remove previous highlights; new ones are added for the visible
+            # part of the text only (see _tag_visible_matches)
+            text.tag_remove("highlight", "1.0", _END)
+            cache["key"] = key
+            cache["matches"] = matches
+            cache["starts"] = [self._index_key(idx) for idx, _ in matches]
+            cache["tagged"] = (0, 0)
 
-        if not idx:
-            messagebox.showinfo("Search", f"'{term}' not found.")
+        matches = cache["matches"]
+        if not matches:
+            text.tag_remove("current_match", "1.0", _END)
+            if not quiet:
+                messagebox.showinfo("Search", f"'{term}' not found.")
             return
 
-        # determine end index
-        end_idx = f"{idx}+{len(term)}c"
-        # highlight
-        self.text.tag_add("highlight", idx, end_idx)
-        self.text.mark_set(tk.INSERT, end_idx)
-        self.text.see(idx)
+        # next match at or after the cursor, wrapping to the top
+        cursor = bisect.bisect_left(cache["starts"], self._index_key(text.index(tk.INSERT)))
+        idx, length = matches[cursor % len(matches)]
+
+        end_idx = f"{idx}+{length}c"
+        text.tag_remove("current_match", "1.0", _END)
+        text.tag_add("current_match", idx, end_idx)
+        text.mark_set(tk.INSERT, end_idx)
+        text.see(idx)
+        self._tag_visible_matches()
+
+    def _on_yscroll(self, first, last):
+        self.text.vbar.set(first, last)
+        self._tag_visible_matches()
+
+    def _tag_visible_matches(self):
+        """
+        Highlight the cached matches on screen, growing the highlighted range
+        of matches outward as the view moves, so highlighting costs
+        O(viewport) instead of O(document) for long explanations.
+        """
+        cache = self._search_cache
+        starts = cache["starts"]
+        lo_done, hi_done = cache["tagged"]
+        if not starts or cache["key"] is None or cache["key"][1] != self._text_version:
+            return
+        if hi_done - lo_done == len(starts):
+            return
+
+        text = self.text
+        top_line = self._index_key(text.index("@0,0"))[0]
+        bottom_line = self._index_key(text.index(f"@0,{text.winfo_height()}"))[0]
+        lo = bisect.bisect_left(starts, (top_line, 0))
+        hi = bisect.bisect_left(starts, (bottom_line + 1, 0))
+        if lo_done == hi_done:
+            todo = range(lo, hi)
+        else:
+            # keep the tagged range contiguous: tag the gap on either side
+            lo, hi = min(lo, lo_done), max(hi, hi_done)
+            todo = [*range(lo, lo_done), *range(hi_done, hi)]
+
+        matches = cache["matches"]
+        if todo:
+            text.tag_add("highlight", *(
+                pos for i in todo for pos in (matches[i][0], f"{matches[i][0]}+{matches[i][1]}c")
+            ))
+        cache["tagged"] = (lo, hi)
+
+    def _on_text_modified(self, event=None):
+        # <<Modified>> fires only when the flag flips, so reset it each time
+        self._text_version += 1
+        self.text.edit_modified(False)
+
+    def _find_all(self, term: str, content: str) -> list:
+        """Return (index, length) of every case-insensitive, non-overlapping match of `term`."""
+        if content.isascii() and term.isascii():
+            return self._find_all_ascii(term, content)
+
+        # Unicode case folding: let Tk do it, still in a single search call
+        tk_ = self.text.tk
+        var = str(self._count_var)
+        indices = tk_.splitlist(tk_.call(
+            self.text._w, "search", "-all", "-nocase", "-count", var, "--", term, "1.0", _END
+        ))
+        if not indices:
+            return []
+
+        counts = tk_.call("set", var)
+        counts = (counts,) if isinstance(counts, int) else tk_.splitlist(counts)
+        return [(str(idx), int(count)) for idx, count in zip(indices, counts)]
+
+    @staticmethod
+    def _find_all_ascii(term: str, content: str) -> list:
+        """
+        ASCII fast path: lowercase the text once and walk it with str.find,
+        then map character offsets to Tk "line.col" indices through a table
+        of line start offsets.
+        """
+        haystack = content.lower()
+        needle = term.lower()
+        size = len(needle)
+
+        line_starts = [0]
+        pos = content.find("\n")
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = content.find("\n", pos + 1)
+
+        matches = []
+        pos = haystack.find(needle)
+        while pos != -1:
+            line = bisect.bisect_right(line_starts, pos)
+            matches.append((f"{line}.{pos - line_starts[line - 1]}", size))
+            pos = haystack.find(needle, pos + size)
+        return matches
+
+    @staticmethod
+    def _index_key(index: str) -> tuple:
+        line, _, col = str(index).partition(".")
+        return int(line), int(col)
 
     # ----------------------
     # Helper to expose clipboard to parent (when embedding)
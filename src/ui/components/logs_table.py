@@ -9,16 +9,50 @@ with columns such as timestamp, severity, and short description.
 Features:
 - add_row(timestamp, severity, summary, raw_event)
 - load_rows(list[dict])
+- load_columns(timestamps, summaries, raw_events, severities=None)
 - clear()
 - get_selected() -> dict or None
 - on_double_click(callback)
 
+Rows are virtualized: all rows are kept in a Python list and only the
+slice currently in view is inserted into the Treeview, so loading and
+scrolling cost O(visible rows) in Tk regardless of the log size.
+
 Designed to be used together with event analyzer.
 """
 
+import sys
 import tkinter as tk
+from datetime import datetime, timezone
 from tkinter import ttk
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+_END = "end"
+
+# Fallbacks used to size the rendered window before the widget is mapped
+_DEFAULT_ROW_HEIGHT = 20
+_HEADING_HEIGHT = 28
+
+# Rows moved per mouse-wheel notch
+_WHEEL_ROWS = 3
+
+# Severity sort rank (most severe first); unknown / empty values sort last
+_SEVERITY_RANK = {"critical": 0, "error": 1, "warning": 2, "info": 3}
+
+
+def _timestamp_sort_key(value: str) -> tuple:
+    """Sort ISO timestamps chronologically, anything unparsable after them as text."""
+    try:
+        dt = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return (1, value)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (0, dt)
+
+
+def _severity_sort_key(value: str) -> tuple:
+    return (_SEVERITY_RANK.get(value.strip().lower(), len(_SEVERITY_RANK)), value)
 
 
 class LogsTable(ttk.Frame):
@@ -27,10 +61,16 @@ class LogsTable(ttk.Frame):
 
         ttk.Label(self, text="Log Table", font=("Arial", 11, "bold")).pack(anchor="w")
 
-        # Table setup
+        # Table setup: the scrollbar drives which slice of the rows is rendered,
+        # the Treeview itself never holds more rows than fit on screen
+        body = ttk.Frame(self)
+        body.pack(fill=tk.BOTH, expand=True)
+
         columns = ("timestamp", "severity", "summary")
-        self.tree = ttk.Treeview(self, columns=columns, show="headings", selectmode="browse")
-        self.tree.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(body, columns=columns, show="headings", selectmode="browse")
+        self._vsb = ttk.Scrollbar(body, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self._vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # Column configuration
         self.tree.heading("timestamp", text="Timestamp", command=lambda: self._sort_by("timestamp"))
@@ -41,8 +81,38 @@ class LogsTable(ttk.Frame):
         self.tree.column("severity", width=100, anchor="center")
         self.tree.column("summary", width=600, anchor="w")
 
-        # Store raw event content for each row
-        self._raw_event_map = {}
+        # Row model, one list per column indexed by row id (no per-row dict),
+        # plus the display order (row ids) and the first displayed position.
+        # Tree item ids are the row ids as strings.
+        self._timestamps: List[str] = []
+        self._severities: List[str] = []
+        self._summaries: List[str] = []
+        self._raw_events: List[str] = []
+        self._order: List[int] = []
+
+        # Event logs repeat the same messages and timestamps constantly: equal
+        # strings are stored once and shared between rows (reset on clear)
+        self._string_pool: Dict[str, str] = {}
+        self._first = 0
+        self._visible = int(self.tree.cget("height"))
+
+        # Column the display order is currently sorted by (a repeat click on
+        # it reverses the order)
+        self._sort_column = None
+
+        # Selection survives its row being scrolled out of the rendered window
+        self._selected_index = None
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+
+        # Scrolling / resizing re-render the window
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-_WHEEL_ROWS))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(_WHEEL_ROWS))
+        self.tree.bind("<Up>", lambda e: self._on_arrow(-1))
+        self.tree.bind("<Down>", lambda e: self._on_arrow(1))
+        self.tree.bind("<Prior>", lambda e: self._scroll_by(-self._visible))
+        self.tree.bind("<Next>", lambda e: self._scroll_by(self._visible))
 
         # Double-click callback
         self._double_click_callback = None
@@ -52,13 +122,24 @@ class LogsTable(ttk.Frame):
     # Add a row to the table
     # -----------------------------------------------------
     def add_row(self, timestamp: str, severity: str, summary: str, raw_event: str):
-        item_id = self.tree.insert("", tk.END, values=(timestamp, severity, summary))
-        self._raw_event_map[item_id] = {
-            "timestamp": timestamp,
-            "severity": severity,
-            "summary": summary,
-            "raw_event": raw_event,
-        }
+        pool = self._string_pool
+        timestamp = pool.setdefault(timestamp, timestamp)
+        severity = sys.intern(str(severity))
+        summary = pool.setdefault(summary, summary)
+        raw_event = pool.setdefault(raw_event, raw_event)
+
+        index = len(self._timestamps)
+        self._timestamps.append(timestamp)
+        self._severities.append(severity)
+        self._summaries.append(summary)
+        self._raw_events.append(raw_event)
+        self._order.append(index)
+        self._sort_column = None
+
+        # Only touch the tree if the new row lands inside the rendered window
+        if len(self._order) <= self._first + self._visible:
+            self.tree.insert("", _END, iid=str(index), values=(timestamp, severity, summary))
+        self._update_scrollbar()
 
     # -----------------------------------------------------
     # Load many rows at once
@@ -76,31 +157,87 @@ class LogsTable(ttk.Frame):
         ]
         """
         self.clear()
+
+        timestamps, severities = self._timestamps, self._severities
+        summaries, raw_events = self._summaries, self._raw_events
+        share = self._string_pool.setdefault
+        intern = sys.intern
         for row in rows:
-            self.add_row(
-                row.get("timestamp", ""),
-                row.get("severity", ""),
-                row.get("summary", ""),
-                row.get("raw_event", ""),
-            )
+            timestamp = row.get("timestamp", "")
+            summary = row.get("summary", "")
+            raw_event = row.get("raw_event", "")
+            timestamps.append(share(timestamp, timestamp))
+            severities.append(intern(str(row.get("severity", ""))))
+            summaries.append(share(summary, summary))
+            raw_events.append(share(raw_event, raw_event))
+
+        self._order = list(range(len(timestamps)))
+        self._render()
+
+    def load_columns(self, timestamps: List[str], summaries: List[str], raw_events: List[str],
+                     severities: Optional[List[str]] = None):
+        """
+        Same as load_rows() from parallel column lists (index i is one row),
+        without a dict per row. The lists are copied, not kept.
+        """
+        self.clear()
+        share = self._string_pool.setdefault
+        self._timestamps = [share(t, t) for t in timestamps]
+        self._summaries = [share(s, s) for s in summaries]
+        # Raw events are the caller's own strings (MainWindow keeps them
+        # loaded), so sharing them here would save nothing
+        self._raw_events = list(raw_events)
+        if severities is None:
+            self._severities = [""] * len(self._timestamps)
+        else:
+            self._severities = [sys.intern(str(s)) for s in severities]
+        self._order = list(range(len(self._timestamps)))
+        self._render()
 
     # -----------------------------------------------------
     # Clear table
     # -----------------------------------------------------
     def clear(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        self._raw_event_map.clear()
+        # One Tcl call for all rows instead of one per row
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._timestamps = []
+        self._severities = []
+        self._summaries = []
+        self._raw_events = []
+        self._string_pool = {}
+        self._order = []
+        self._sort_column = None
+        self._first = 0
+        self._selected_index = None
+        self._update_scrollbar()
 
     # -----------------------------------------------------
     # Get selected row’s full data
     # -----------------------------------------------------
     def get_selected(self) -> Dict[str, Any] | None:
         selection = self.tree.selection()
-        if not selection:
-            return None
-        item_id = selection[0]
-        return self._raw_event_map.get(item_id)
+        if selection:
+            return self._row_dict(int(selection[0]))
+        if self._selected_index is not None:
+            return self._row_dict(self._selected_index)
+        return None
+
+    def _row_dict(self, index: int) -> Dict[str, Any]:
+        return {
+            "timestamp": self._timestamps[index],
+            "severity": self._severities[index],
+            "summary": self._summaries[index],
+            "raw_event": self._raw_events[index],
+        }
+
+    def _on_select(self, event=None):
+        # Rendering a window without the selected row empties the tree
+        # selection; keep the last real selection in that case
+        selection = self.tree.selection()
+        if selection:
+            self._selected_index = int(selection[0])
 
     # -----------------------------------------------------
     # Double-click handler
@@ -116,17 +253,133 @@ class LogsTable(ttk.Frame):
         if row:
             self._double_click_callback(row)
 
+    # -----------------------------------------------------
+    # Virtualized rendering
+    # -----------------------------------------------------
+    def _render(self):
+        """Show the rows for display positions [_first, _first + _visible)."""
+        self._first = max(0, min(self._first, len(self._order) - self._visible))
+        window = self._order[self._first:self._first + self._visible]
+
+        # Rows that stay in view (most of them when scrolling) are kept as-is;
+        # only rows leaving the window are deleted and only new ones inserted
+        present = set(self.tree.get_children())
+        wanted = {str(index) for index in window}
+        stale = present - wanted
+        if stale:
+            self.tree.delete(*stale)
+
+        # Bind the insert method and column lists once for the loop
+        insert = self.tree.insert
+        timestamps, severities, summaries = self._timestamps, self._severities, self._summaries
+        iids = []
+        for index in window:
+            iid = str(index)
+            if iid not in present:
+                insert(
+                    "", _END, iid=iid,
+                    values=(timestamps[index], severities[index], summaries[index]),
+                )
+            iids.append(iid)
+
+        # Put the window in display order with one Tcl call (no per-row move)
+        if iids:
+            self.tree.set_children("", *iids)
+
+        if self._selected_index is not None and self.tree.exists(str(self._selected_index)):
+            self.tree.selection_set(str(self._selected_index))
+
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        total = len(self._order)
+        if total <= self._visible:
+            self._vsb.set(0.0, 1.0)
+        else:
+            self._vsb.set(self._first / total, (self._first + self._visible) / total)
+
+    def _scroll_to(self, first: int):
+        first = max(0, min(first, len(self._order) - self._visible))
+        if first != self._first:
+            self._first = first
+            self._render()
+        return "break"
+
+    def _scroll_by(self, rows: int):
+        return self._scroll_to(self._first + rows)
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self._scroll_to(int(float(args[0]) * len(self._order)))
+        elif action == "scroll":
+            amount = int(args[0])
+            if args[1] == "pages":
+                amount *= self._visible
+            self._scroll_by(amount)
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small deltas
+        if abs(event.delta) >= 120:
+            notches = event.delta // 120
+        else:
+            notches = 1 if event.delta > 0 else -1
+        return self._scroll_by(-notches * _WHEEL_ROWS)
+
+    def _on_configure(self, event):
+        row_height = ttk.Style(self).lookup("Treeview", "rowheight") or _DEFAULT_ROW_HEIGHT
+        visible = max(1, (event.height - _HEADING_HEIGHT) // int(row_height))
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _on_arrow(self, step: int):
+        """Keep arrow-key navigation going past the edges of the rendered window."""
+        selection = self.tree.selection()
+        if not selection:
+            return None
+
+        target = self._first + self.tree.index(selection[0]) + step
+        if not 0 <= target < len(self._order):
+            return "break"
+        if self._first <= target < self._first + self._visible:
+            return None  # Treeview's own binding moves within the window
+
+        self._scroll_by(step)
+        iid = str(self._order[target])
+        self.tree.selection_set(iid)
+        self.tree.focus(iid)
+        return "break"
+
     # -----------------------------------------------------
     # Sorting functionality
     # -----------------------------------------------------
     def _sort_by(self, column: str):
-        items = [(self.tree.set(iid, column), iid) for iid in self.tree.get_children("")]
+        """Sort by `column`; clicking the same heading again reverses the order."""
+        if column == self._sort_column:
+            # Already sorted on this column: flip in O(N) instead of re-sorting
+            self._order.reverse()
+        else:
+            values = {
+                "timestamp": self._timestamps,
+                "severity": self._severities,
+                "summary": self._summaries,
+            }[column]
+            typed_key = {
+                "timestamp": _timestamp_sort_key,
+                "severity": _severity_sort_key,
+            }.get(column)
 
-        # Basic alpha sort
-        items.sort(key=lambda x: x[0])
+            # Sort the whole model, not just the rendered rows; each typed key
+            # is computed once per row rather than once per comparison
+            if typed_key is None:
+                self._order.sort(key=values.__getitem__)
+            else:
+                keys = [typed_key(v) for v in values]
+                self._order.sort(key=keys.__getitem__)
+            self._sort_column = column
 
-        for index, (value, iid) in enumerate(items):
-            self.tree.move(iid, "", index)
+        self._first = 0
+        self._render()
 
 
 # Standalone test
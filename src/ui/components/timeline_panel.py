@@ -9,10 +9,15 @@ Features:
 - Displays events in chronological order
 - Attempts to extract timestamps automatically
 - Click on an event to view full details (callback)
-- Scrollable canvas-based timeline layout
+- Scrollable canvas-based timeline layout; only the rows in view are
+  drawn, on a small pool of reused canvas items, so large logs load and
+  scroll in constant time
+- Rows have a fixed height to make that possible, so each shows only the
+  event's first line (cut to 120 characters); the full text is what the
+  select callback receives
 
 Public API:
-- load_events(events: list[str])
+- load_events(events: list[str], timestamps: list[str] | None = None)
 - clear()
 - set_on_select(callback: function(event_text: str))
 """
@@ -23,6 +28,34 @@ import re
 
 from src.main.logger import logger
 
+# Timestamp shapes recognised by the timeline, compiled once and tried in
+# priority order: an event showing several timestamps displays the one of the
+# first shape it contains, not whichever comes first in the text
+_TS_PATTERNS = tuple(re.compile(p) for p in (
+    r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}",
+    r"\d{2}/\d{2}/\d{4} \d{1,2}:\d{2}(?: AM| PM)?",
+    r"\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2}",
+))
+
+_NO_TIMESTAMP = "(No timestamp)"
+
+# Row layout on the canvas (pixels). Rows have a fixed height so the rows in
+# view can be computed from the scroll position; each shows the first line
+# of its event (the full text goes to the select callback).
+_TEXT_X = 24
+_TEXT_WIDTH = 600
+_ROW_HEIGHT = 60
+_SUMMARY_CHARS = 120
+
+# Canvas tags shared by every row's items; the row a click belongs to is
+# derived from its y coordinate, so no per-row tag is needed
+_ROW_TAGS = ("row", "click")
+
+# Each row is two text items: "●  <timestamp>" (the dot marker is a glyph,
+# not a separate oval) and the summary line below it
+_MARKER_X = 6
+_MARKER = "\u25cf  "
+
 
 class TimelinePanel(ttk.Frame):
     def __init__(self, master=None, **kwargs):
@@ -37,32 +70,27 @@ class TimelinePanel(ttk.Frame):
         self.canvas = tk.Canvas(container, highlightthickness=0)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        scrollbar = ttk.Scrollbar(container, orient="vertical", command=self.canvas.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._scrollbar = ttk.Scrollbar(container, orient="vertical", command=self.canvas.yview)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        # Every view change (scrolling, resizing) redraws the visible rows
+        self.canvas.configure(yscrollcommand=self._on_yview_changed)
 
-        # Frame inside canvas
-        self.inner_frame = ttk.Frame(self.canvas)
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.inner_frame, anchor="nw")
-
-        self.inner_frame.bind("<Configure>", self._on_frame_configure)
-        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        # Entries are drawn as canvas items rather than widgets; one binding
+        # serves every clickable item
+        self.canvas.tag_bind("click", "<Button-1>", self._on_row_click)
+        self._rendered = None  # (first, last) row range currently drawn
+        # Canvas items of each drawn row, reused when the view scrolls so
+        # redrawing only moves items and swaps their text
+        self._slots = []
 
         # Selection callback
         self._on_select_callback = None
 
-        # Internal event cache
+        # Internal event cache, with the extracted timestamps alongside
+        # (None until the row is first drawn; see _render_visible)
         self.events = []
-
-    # -------------------------------------------------------------
-    # Layout auto adjustment
-    # -------------------------------------------------------------
-    def _on_frame_configure(self, event):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-
-    def _on_canvas_configure(self, event):
-        self.canvas.itemconfig(self.canvas_window, width=event.width)
+        self._timestamps = []
 
     # -------------------------------------------------------------
     # Timestamp extraction (simple heuristic)
@@ -74,61 +102,102 @@ class TimelinePanel(ttk.Frame):
         01/25/2024 10:33 AM
         25-01-2024 12:00:10
         """
-        patterns = [
-            r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}",
-            r"\d{2}/\d{2}/\d{4} \d{1,2}:\d{2}(?: AM| PM)?",
-            r"\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2}",
-        ]
-
-        for p in patterns:
-            m = re.search(p, text)
+        for pattern in _TS_PATTERNS:
+            m = pattern.search(text)
             if m:
                 return m.group(0)
-
-        return "(No timestamp)"
+        return _NO_TIMESTAMP
 
     # -------------------------------------------------------------
     # Load events into timeline
     # -------------------------------------------------------------
-    def load_events(self, events):
+    def load_events(self, events, timestamps=None):
+        """
+        Show `events` on the timeline. Callers that already know each
+        event's timestamp (e.g. from a structured log source) can pass them
+        as `timestamps`, parallel to `events`, to skip extraction entirely.
+        """
         self.clear()
         self.events = events
+        if timestamps is not None:
+            self._timestamps = list(timestamps)
+        else:
+            self._timestamps = [None] * len(events)
 
-        for idx, ev in enumerate(events, start=1):
-            timestamp = self._extract_timestamp(ev)
-            self._add_timeline_entry(idx, timestamp, ev)
+        self.canvas.configure(
+            scrollregion=(0, 0, _TEXT_X + _TEXT_WIDTH, len(events) * _ROW_HEIGHT)
+        )
+        self.canvas.yview_moveto(0)
+        self._render_visible()
 
         logger.info("Timeline loaded with %d events", len(events))
 
     # -------------------------------------------------------------
-    # Add timeline entry widget
+    # Virtualized drawing
     # -------------------------------------------------------------
-    def _add_timeline_entry(self, index: int, timestamp: str, text: str):
-        frame = ttk.Frame(self.inner_frame, padding=5)
-        frame.pack(fill=tk.X, anchor="w", pady=2)
-
-        # Dot + connecting line style timeline marker
-        marker_canvas = tk.Canvas(frame, width=20, height=20, highlightthickness=0)
-        marker_canvas.pack(side=tk.LEFT)
-        marker_canvas.create_oval(6, 6, 14, 14, fill="#2563EB", outline="")
-
-        # Event box
-        event_frame = ttk.Frame(frame, padding=(10, 5))
-        event_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-        lbl_time = ttk.Label(event_frame, text=timestamp, foreground="#6B7280")
-        lbl_time.pack(anchor="w")
-
-        lbl_event = ttk.Label(event_frame, text=text, wraplength=600, justify=tk.LEFT)
-        lbl_event.pack(anchor="w")
-
-        # Bind click
-        lbl_event.bind("<Button-1>", lambda e, content=text: self._handle_select(content))
-        lbl_time.bind("<Button-1>", lambda e, content=text: self._handle_select(content))
+    def _on_yview_changed(self, first, last):
+        self._scrollbar.set(first, last)
+        self._render_visible()
+
+    def _render_visible(self):
+        """Draw only the rows intersecting the visible part of the canvas."""
+        canvas = self.canvas
+        first = max(0, int(canvas.canvasy(0) // _ROW_HEIGHT))
+        last = min(len(self.events), first + canvas.winfo_height() // _ROW_HEIGHT + 2)
+        if (first, last) == self._rendered:
+            return
+
+        slots = self._slots
+        while len(slots) < last - first:
+            slots.append(self._create_slot())
+
+        timestamps = self._timestamps
+        for slot, i in zip(slots, range(first, last)):
+            timestamp = timestamps[i]
+            if timestamp is None:
+                timestamp = timestamps[i] = self._extract_timestamp(self.events[i])
+            self._add_timeline_entry(slot, i + 1, timestamp, self.events[i])
+
+        # Rows past the end of the log leave their slots unused
+        for slot in slots[max(0, last - first):]:
+            for item in slot:
+                canvas.itemconfigure(item, state="hidden")
+        self._rendered = (first, last)
+
+    def _create_slot(self) -> tuple:
+        """Create the (hidden) canvas items for one row: marker + timestamp, summary."""
+        canvas = self.canvas
+        return (
+            canvas.create_text(0, 0, anchor="nw", fill="#2563EB", state="hidden", tags=_ROW_TAGS),
+            canvas.create_text(
+                0, 0, anchor="nw", width=_TEXT_WIDTH, justify=tk.LEFT, state="hidden", tags=_ROW_TAGS
+            ),
+        )
+
+    def _add_timeline_entry(self, slot: tuple, index: int, timestamp: str, text: str):
+        canvas = self.canvas
+        y = (index - 1) * _ROW_HEIGHT
+
+        summary = text.partition("\n")[0]
+        if len(summary) > _SUMMARY_CHARS:
+            summary = summary[:_SUMMARY_CHARS] + "\u2026"
+
+        # Dot marker and timestamp, then the event's first line
+        header_item, summary_item = slot
+        canvas.coords(header_item, _MARKER_X, y + 4)
+        canvas.itemconfigure(header_item, text=_MARKER + timestamp, state="normal")
+        canvas.coords(summary_item, _TEXT_X, y + 22)
+        canvas.itemconfigure(summary_item, text=summary, state="normal")
 
     # -------------------------------------------------------------
     # Click handler
     # -------------------------------------------------------------
+    def _on_row_click(self, event):
+        # Fixed row height: the canvas y coordinate gives the row directly
+        index = int(self.canvas.canvasy(event.y) // _ROW_HEIGHT)
+        if 0 <= index < len(self.events):
+            self._handle_select(self.events[index])
+
     def _handle_select(self, event_text: str):
         if self._on_select_callback:
             self._on_select_callback(event_text)
@@ -144,9 +213,12 @@ class TimelinePanel(ttk.Frame):
     # Clear timeline
     # -------------------------------------------------------------
     def clear(self):
-        for w in self.inner_frame.winfo_children():
-            w.destroy()
+        self.canvas.delete("row")
+        self.canvas.configure(scrollregion=(0, 0, 0, 0))
+        self._rendered = None
+        self._slots = []
         self.events = []
+        self._timestamps = []
 
 
 # Standalone widget test
@@ -13,19 +13,25 @@ Features:
 - Load-count dropdown to control how many events to fetch/display
 """
 
+import heapq
 import os
 import platform
+from bisect import bisect_left, bisect_right
+import queue
 import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 
 from src.main.logger import logger
 from src.main.config import load_config, save_app_settings
 from src.api.api_client_gemini import GeminiClient
 from src.api.event_analyzer import analyze
-from src.api.ai_explainer import get_explanation
+from src.api.ai_explainer import get_cached_explanation, get_explanation
 from src.utils.file_loader import load_file
 from src.utils.parser import parse_log
 from src.utils.validators import is_valid_api_key
@@ -52,17 +58,267 @@ except Exception:
     TimelinePanel = None
     LogsTable = None
 
+# Settings dialog, imported up front rather than on every open
+try:
+    from src.ui.settings_dialog import SettingsDialog
+except Exception:
+    logger.exception("Failed to import SettingsDialog")
+    SettingsDialog = None
+
 
 LOG_TYPES = ["System", "Application", "Security"]
 
+# SimpleLogsTable window sizing before the widget is mapped, and rows moved
+# per mouse-wheel notch
+_TREE_ROW_HEIGHT = 20
+_TREE_HEADING_HEIGHT = 28
+_TREE_WHEEL_ROWS = 3
+
+# How long log type / load count selections must settle before they are
+# applied (and possibly start a Windows Event Log read) (ms)
+_SELECT_DEBOUNCE_MS = 150
+
+# How often the Tk thread checks on background reads (Windows Event Log,
+# user files) for a result (ms)
+_POLL_MS = 50
+
+# Timestamp patterns for MainWindow._extract_event_timestamp, compiled once
+# and tried in priority order
+_EVENT_TS_PATTERNS = tuple(re.compile(p) for p in (
+    r"\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}",
+    r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}",
+    r"\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}(?::\d{2})?\s?(?:AM|PM|am|pm)?",
+    r"\d{1,2}-\d{1,2}-\d{4} \d{2}:\d{2}:\d{2}",
+    r"^\d{2}:\d{2}:\d{2}",
+    # weekday + month name e.g. "Wed Dec 10 16:36:41 2025"
+    r"[A-Za-z]{3}\s+[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}\s+\d{4}",
+    # month name e.g. "Dec 10 16:36:41 2025" or "Dec 10 16:36:41"
+    r"[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}(?:\s+\d{4})?",
+    # day month year format e.g. "10 Dec 2025 16:36:41"
+    r"\d{1,2}\s+[A-Za-z]{3}\s+\d{4}\s+\d{2}:\d{2}:\d{2}",
+))
+# Every pattern above contains a clock time ("H:MM"); text without one
+# cannot match any of them, which one search rules out
+_CLOCK_RE = re.compile(r"\d:\d\d")
+
+
+def _parse_iso_prefix(text: str) -> Optional[datetime]:
+    """
+    Fast path for events that start with "YYYY-MM-DD HH:MM:SS" (or a "T"
+    separator, as wevtutil dates do): check the punctuation at fixed offsets
+    and hand the 19-char prefix to the C-level datetime.fromisoformat,
+    skipping the regex scan and the strptime format loop.
+    """
+    if (
+        len(text) >= 19
+        and text[4] == "-" and text[7] == "-" and text[10] in " T"
+        and text[13] == ":" and text[16] == ":"
+        and text[:4].isdigit()
+    ):
+        try:
+            return datetime.fromisoformat(text[:19])
+        except ValueError:
+            return None
+    return None
+
+
+# Formats tried by MainWindow._try_parse_datetime, in priority order
+_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%m/%d/%Y %I:%M:%S %p",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%d-%m-%Y %H:%M:%S",
+    "%d/%m/%Y %I:%M:%S %p",
+    "%d/%m/%Y %I:%M %p",
+    "%H:%M:%S",
+    "%I:%M:%S %p",
+    "%I:%M %p",
+    # Month name formats (English): "Wed Dec 10 16:36:41 2025"
+    "%a %b %d %H:%M:%S %Y",
+    "%b %d %H:%M:%S %Y",
+    "%a %b %d %H:%M:%S",   # without year
+    "%b %d %H:%M:%S",      # without year
+    "%d %b %Y %H:%M:%S",
+    "%d %b %H:%M:%S",
+)
+
+# A string's shape: its punctuation in order, whether it has letters, and
+# whether it starts with one (a day/month name rather than a number).
+# strptime fields only consume digits, letters (names, AM/PM) and spaces,
+# and match from the first character, so a string can only parse with
+# formats of the same shape.
+_PUNCT_RE = re.compile(r"[\w\s]+")
+_LETTER_RE = re.compile(r"[^\W\d_]")
+_DIRECTIVE_RE = re.compile(r"%[a-zA-Z]")
+
+_DatetimeShape = Tuple[str, bool, bool]
+
+
+def _datetime_shape(s: str) -> _DatetimeShape:
+    return _PUNCT_RE.sub("", s), _LETTER_RE.search(s) is not None, s[:1].isalpha()
+
+
+def _format_shape(fmt: str) -> _DatetimeShape:
+    directives = _DIRECTIVE_RE.findall(fmt)
+    literal = _DIRECTIVE_RE.sub("", fmt)
+    leading = _DIRECTIVE_RE.match(fmt)
+    return (
+        _PUNCT_RE.sub("", literal),
+        any(d[1] in "aAbBp" for d in directives),
+        leading is not None and leading.group(0)[1] in "aAbBp",
+    )
+
+
+def _build_formats_by_shape() -> Dict[_DatetimeShape, Tuple[str, ...]]:
+    """Group _DATETIME_FORMATS by shape, keeping priority order within each group."""
+    by_shape: Dict[_DatetimeShape, Tuple[str, ...]] = {}
+    for fmt in _DATETIME_FORMATS:
+        shape = _format_shape(fmt)
+        by_shape[shape] = by_shape.get(shape, ()) + (fmt,)
+    return by_shape
+
+
+_FORMATS_BY_SHAPE = _build_formats_by_shape()
+
+# Every character str.splitlines() treats as a line boundary
+_LINE_BREAK_RE = re.compile("[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def _first_line(text: str, n: int = 120) -> str:
+    """splitlines()[0][:n] without splitting the whole text (and "" for empty text)."""
+    m = _LINE_BREAK_RE.search(text, 0, n)
+    return text[:m.start()] if m else text[:n]
+
+
+@lru_cache(maxsize=4096)
+def _event_columns(event_text: str) -> Tuple[str, str]:
+    """
+    (timestamp field, summary line) shown in the logs table for one event.
+    Cached because the same event strings are re-shown on every log-type,
+    refresh and time-range change.
+    """
+    return event_text.split("\t", 1)[0], _first_line(event_text)
+
+
+_ISO_TS_RE = re.compile(r"\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}")
+
+# Zero-padded "YYYY-MM-DD[ HH:MM[:SS]]": the C-level datetime.fromisoformat
+# parses these to the same value strptime's ISO formats would, much faster
+_STRICT_ISO_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}(?: [0-9]{2}:[0-9]{2}(?::[0-9]{2})?)?")
+
+
+@lru_cache(maxsize=65536)
+def _parse_datetime_text(s: str) -> Optional[datetime]:
+    """
+    Body of MainWindow._try_parse_datetime. Cached on the raw string: logs
+    repeat the same timestamps (and tokens) across events and across
+    time-range queries, and strptime is slow.
+    """
+    s = s.strip()
+    # normalize basic ISO Z and remove stray dots
+    s = s.replace("T", " ").replace("Z", "").replace(".", "")
+    if _STRICT_ISO_RE.fullmatch(s):
+        try:
+            return datetime.fromisoformat(s)
+        except ValueError:
+            pass  # out-of-range field; let strptime have the final say
+    # Only formats of the same shape can match; skip the rest without
+    # paying for a raised ValueError each
+    for fmt in _FORMATS_BY_SHAPE.get(_datetime_shape(s), ()):
+        try:
+            dt = datetime.strptime(s, fmt)
+            return dt
+        except Exception:
+            continue
+    # try to extract iso-like substring
+    iso_re = _ISO_TS_RE.search(s)
+    if iso_re:
+        try:
+            return datetime.fromisoformat(iso_re.group(0).replace("T", " "))
+        except Exception:
+            pass
+    return None
+
+
+def _explainer_text(master, height: int) -> scrolledtext.ScrolledText:
+    """
+    Plain-Text stand-in for ExplanationPanel: read-only and without an undo
+    stack, since it is only ever rewritten whole (see _set_panel_text).
+    """
+    return scrolledtext.ScrolledText(
+        master, wrap=tk.WORD, height=height, undo=False, maxundo=0, state=tk.DISABLED
+    )
+
+
+@lru_cache(maxsize=16384)
+def _event_timestamp(event_text: str) -> Optional[datetime]:
+    """
+    Body of MainWindow._extract_event_timestamp. Cached on the event text, so
+    re-reading a log (a refresh, or switching back to a log type) finds the
+    timestamps of events it has already seen without another regex scan.
+    """
+    dt = _parse_iso_prefix(event_text)
+    if dt:
+        return dt
+    snippet = event_text[:400]  # scan a bit further for verbose lines
+    if _CLOCK_RE.search(snippet):
+        for pattern in _EVENT_TS_PATTERNS:
+            m = pattern.search(snippet)
+            if m:
+                # A match is never empty, so skip _try_parse_datetime's guard
+                dt = _parse_datetime_text(m.group(0))
+                if dt:
+                    return dt
+    # last-resort token scan; every format needs digits, so plain words
+    # (most of a message) are skipped without a parse attempt
+    for t in snippet.split():
+        if not t.isalpha():
+            dt = _parse_datetime_text(t)
+            if dt:
+                return dt
+    return None
+
+
+def _run_in_background(slots: threading.BoundedSemaphore, name: str, fn, *args, **kwargs) -> Future:
+    """
+    Run fn(*args, **kwargs) on a daemon thread once one of `slots` is free
+    and return a Future for its result. Unlike ThreadPoolExecutor workers,
+    which are joined at interpreter exit, these never keep the app alive
+    after its window closes (a Gemini call with retries can take ~40s).
+    A future cancelled before it gets a slot never runs.
+    """
+    future: Future = Future()
+
+    def run():
+        with slots:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
 
 class SimpleLogsTable(ttk.Frame):
     """
     Fallback logs table implemented with ttk.Treeview when LogsTable component is absent.
     Exposes:
       - load_rows(rows: List[dict])
+      - load_columns(timestamps, summaries, raw_events, severities=None)
       - get_selected() -> dict | None
       - on_double_click(callback)
+
+    Like LogsTable, only the rows in view are inserted into the Treeview; the
+    scrollbar and mouse wheel move that window over the row list.
     """
     def __init__(self, master=None):
         super().__init__(master)
@@ -75,37 +331,151 @@ class SimpleLogsTable(ttk.Frame):
         self.tree.column("summary", width=400, anchor="w")
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.tree.config(yscrollcommand=scrollbar.set)
+        self._vsb = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self._vsb.pack(side=tk.RIGHT, fill=tk.Y)
 
         self._double_click_cb = None
         self.tree.bind("<Double-1>", self._on_double)
 
-        # store rows so we can return raw_event on selection
-        self._rows = []
+        # Rows as parallel columns (index = row), so get_selected can return raw_event
+        self._timestamps: List[str] = []
+        self._severities: List[str] = []
+        self._summaries: List[str] = []
+        self._raw_events: List[str] = []
+        # Rendered window: first row shown, rows that fit, and the iids
+        # currently in the tree (tree iids are row indexes as strings)
+        self._first = 0
+        self._visible = int(self.tree.cget("height"))
+        self._iids: List[str] = []
+        # Selection survives its row being scrolled out of the window
+        self._selected_index = None
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_by(-_TREE_WHEEL_ROWS))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_by(_TREE_WHEEL_ROWS))
+        self.tree.bind("<Up>", lambda e: self._on_arrow(-1))
+        self.tree.bind("<Down>", lambda e: self._on_arrow(1))
+        self.tree.bind("<Prior>", lambda e: self._scroll_by(-self._visible))
+        self.tree.bind("<Next>", lambda e: self._scroll_by(self._visible))
 
     def load_rows(self, rows: List[dict]):
-        self._rows = rows or []
-        self.tree.delete(*self.tree.get_children())
-        for i, r in enumerate(rows):
-            ts = r.get("timestamp", "")
-            sev = r.get("severity", "")
-            summ = r.get("summary", "")[:400]
-            self.tree.insert("", "end", iid=str(i), values=(ts, sev, summ))
+        rows = rows or []
+        self.load_columns(
+            [r.get("timestamp", "") for r in rows],
+            [r.get("summary", "") for r in rows],
+            [r.get("raw_event", "") for r in rows],
+            [r.get("severity", "") for r in rows],
+        )
+
+    def load_columns(self, timestamps: List[str], summaries: List[str], raw_events: List[str],
+                     severities: Optional[List[str]] = None):
+        """Same as load_rows() from parallel column lists, without a dict per row."""
+        self._timestamps = list(timestamps)
+        self._summaries = list(summaries)
+        self._raw_events = list(raw_events)
+        self._severities = list(severities) if severities is not None else [""] * len(self._timestamps)
+        self._first = 0
+        self._selected_index = None
+        self._render()
 
     def get_selected(self) -> Optional[dict]:
         sel = self.tree.selection()
-        if not sel:
-            return None
-        try:
-            idx = int(sel[0])
-        except Exception:
+        if sel:
+            try:
+                idx = int(sel[0])
+            except Exception:
+                return None
+        elif self._selected_index is not None:
+            idx = self._selected_index
+        else:
             return None
-        if 0 <= idx < len(self._rows):
-            return self._rows[idx]
+        if 0 <= idx < len(self._timestamps):
+            return {
+                "timestamp": self._timestamps[idx],
+                "severity": self._severities[idx],
+                "summary": self._summaries[idx],
+                "raw_event": self._raw_events[idx],
+            }
         return None
 
+    def _on_select(self, _event=None):
+        sel = self.tree.selection()
+        if sel:
+            self._selected_index = int(sel[0])
+
+    def _render(self):
+        """Show rows [_first, _first + _visible) in the tree."""
+        total = len(self._timestamps)
+        self._first = max(0, min(self._first, total - self._visible))
+        if self._iids:
+            self.tree.delete(*self._iids)
+        # Bind the insert method and column lists once for the loop
+        insert = self.tree.insert
+        timestamps, severities, summaries = self._timestamps, self._severities, self._summaries
+        window = range(self._first, min(total, self._first + self._visible))
+        self._iids = [str(i) for i in window]
+        for i, iid in zip(window, self._iids):
+            insert("", "end", iid=iid, values=(timestamps[i], severities[i], summaries[i][:400]))
+
+        if self._selected_index is not None and self.tree.exists(str(self._selected_index)):
+            self.tree.selection_set(str(self._selected_index))
+
+        if total <= self._visible:
+            self._vsb.set(0.0, 1.0)
+        else:
+            self._vsb.set(self._first / total, (self._first + self._visible) / total)
+
+    def _scroll_by(self, rows: int):
+        first = max(0, min(self._first + rows, len(self._timestamps) - self._visible))
+        if first != self._first:
+            self._first = first
+            self._render()
+        return "break"
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self._scroll_by(int(float(args[0]) * len(self._timestamps)) - self._first)
+        elif action == "scroll":
+            amount = int(args[0])
+            if args[1] == "pages":
+                amount *= self._visible
+            self._scroll_by(amount)
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small deltas
+        if abs(event.delta) >= 120:
+            notches = event.delta // 120
+        else:
+            notches = 1 if event.delta > 0 else -1
+        return self._scroll_by(-notches * _TREE_WHEEL_ROWS)
+
+    def _on_configure(self, event):
+        row_height = ttk.Style(self).lookup("Treeview", "rowheight") or _TREE_ROW_HEIGHT
+        visible = max(1, (event.height - _TREE_HEADING_HEIGHT) // int(row_height))
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _on_arrow(self, step: int):
+        """Keep arrow-key navigation going past the edges of the rendered window."""
+        sel = self.tree.selection()
+        if not sel:
+            return None
+
+        target = int(sel[0]) + step
+        if not 0 <= target < len(self._timestamps):
+            return "break"
+        if self._first <= target < self._first + self._visible:
+            return None  # Treeview's own binding moves within the window
+
+        self._scroll_by(step)
+        iid = str(target)
+        self.tree.selection_set(iid)
+        self.tree.focus(iid)
+        return "break"
+
     def on_double_click(self, cb):
         self._double_click_cb = cb
 
@@ -128,8 +498,42 @@ class MainWindow:
         # Events storage
         self._loaded_events: List[str] = []
         self._filtered_events: List[str] = []
+        # (events, sorted timestamps, event positions) for the filtered events;
+        # built on the first time-range query and reused until the events
+        # themselves change. Events without a timestamp never match a range,
+        # so they are left out.
+        self._time_index: Optional[Tuple[List[str], List[datetime], List[int]]] = None
+        # Table columns of the filtered events, kept parallel to
+        # _filtered_events; _columns_events is the list they were split from,
+        # so re-showing the same list skips the split
+        self._columns_events: Optional[List[str]] = None
+        self._event_timestamps: List[str] = []
+        self._event_summaries: List[str] = []
         self._last_loaded_winlog_type: Optional[str] = None
         self._loaded_from_file: bool = False  # True when events come from a user-opened file
+        # Windows Event Log reads run on worker threads and post
+        # (log_type, events) here; _winlog_pending is the log awaited and
+        # _winlog_reading the one being read (one read at a time)
+        self._winlog_results: "queue.Queue[Tuple[str, Optional[List[str]]]]" = queue.Queue()
+        self._winlog_pending: Optional[str] = None
+        self._winlog_reading: Optional[str] = None
+        # Log type / load count combobox changes wait for the selection to
+        # settle (see _schedule_selection); set when the count was changed
+        self._select_after_id = None
+        self._count_changed = False
+        # Reads and parses user-opened files off the Tk thread, two at a time
+        # (see _run_in_background)
+        self._io_slots = threading.BoundedSemaphore(2)
+        # Settings writes (last_opened); one worker keeps them in order, and
+        # a pool worker (joined at exit) lets a write in progress complete
+        self._settings_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="settings")
+        # Gemini requests run in the background too, two at a time; the latest
+        # request per explainer panel is tracked so a newer click supersedes an older one
+        self._gemini_slots = threading.BoundedSemaphore(2)
+        self._active_explanations: Dict[object, Future] = {}
+
+        # Buttons that need a Gemini key, registered as they are built
+        self._key_gated_buttons: List[ttk.Button] = []
 
         # Maximum events to load/display (default 100). None means "All".
         self._max_events: Optional[int] = 100
@@ -162,22 +566,71 @@ class MainWindow:
 
         try:
             logger.info("Auto-loading Windows 'System' event log...")
-            maxrec = self._max_events or 1000
-            events = read_windows_event_log("System", max_records=maxrec)
+            self.log_type_var.set("System")
+            self._start_winlog_read("System")
+        except Exception:
+            logger.exception("Failed to auto-load Windows System log.")
+
+    def _start_winlog_read(self, log_type: str):
+        """Read a Windows Event Log on a worker thread so the UI stays responsive."""
+        if self._winlog_pending == log_type:
+            return  # already being read
+        logger.info("Loading Windows '%s' event log...", log_type)
+        self._winlog_pending = log_type
+        # A read already running can't be cancelled; rather than start
+        # another next to it, _drain_winlog_results starts the latest
+        # selection once it finishes
+        if self._winlog_reading is None:
+            self._launch_winlog_read(log_type)
+            self.root.after(_POLL_MS, self._drain_winlog_results)
+
+    def _launch_winlog_read(self, log_type: str):
+        self._winlog_reading = log_type
+        maxrec = self._max_events or 1000
+        threading.Thread(
+            target=self._read_winlog_worker, args=(log_type, maxrec), daemon=True
+        ).start()
+
+    def _read_winlog_worker(self, log_type: str, max_records: int):
+        # Worker thread: no Tk calls here, only hand the result over
+        try:
+            events = read_windows_event_log(log_type, max_records=max_records)
+        except Exception:
+            logger.exception("Failed to read Windows %s log", log_type)
+            events = None
+        self._winlog_results.put((log_type, events))
+
+    def _drain_winlog_results(self):
+        """Tk thread: apply finished reads, polling again while one is pending."""
+        while True:
+            try:
+                log_type, events = self._winlog_results.get_nowait()
+            except queue.Empty:
+                break
+            self._winlog_reading = None
+            # Drop reads superseded by a later selection or by opening a file
+            if log_type != self._winlog_pending:
+                continue
+            self._winlog_pending = None
+            if self._loaded_from_file:
+                continue
+
             if events:
-                # If the reader returned more than desired and _max_events is set, slice
-                if self._max_events:
+                # The reader is asked for at most _max_events; only slice
+                # (a full copy) if it returned more anyway
+                if self._max_events and len(events) > self._max_events:
                     events = events[: self._max_events]
                 self._loaded_events = events
-                self._last_loaded_winlog_type = "System"
-                self._loaded_from_file = False
-                self.log_type_var.set("System")
-                self._apply_log_type_filter()
-                logger.info("Loaded %d system events", len(events))
-            else:
-                logger.info("No system events found during auto-load.")
-        except Exception:
-            logger.exception("Failed to auto-load Windows System log.")
+                self._last_loaded_winlog_type = log_type
+                logger.info("Loaded %d '%s' events", len(events), log_type)
+            elif events is not None:
+                logger.info("Windows '%s' log returned 0 events.", log_type)
+            self._show_loaded_events()
+
+        if self._winlog_reading is None and self._winlog_pending is not None:
+            self._launch_winlog_read(self._winlog_pending)
+        if self._winlog_reading is not None:
+            self.root.after(_POLL_MS, self._drain_winlog_results)
 
     # ---------------------------
     # Menu
@@ -224,7 +677,7 @@ class MainWindow:
         self.log_type_var = tk.StringVar(value=LOG_TYPES[0])
         self.log_type_cb = ttk.Combobox(ctrl_frame, textvariable=self.log_type_var, values=LOG_TYPES, state="readonly", width=12)
         self.log_type_cb.pack(side=tk.LEFT)
-        self.log_type_cb.bind("<<ComboboxSelected>>", lambda e: self._apply_log_type_filter())
+        self.log_type_cb.bind("<<ComboboxSelected>>", lambda e: self._schedule_selection())
 
         ttk.Button(ctrl_frame, text="Refresh", command=self._apply_log_type_filter).pack(side=tk.LEFT, padx=6)
 
@@ -235,7 +688,7 @@ class MainWindow:
         self.load_count_cb = ttk.Combobox(ctrl_frame, textvariable=self.load_count_var,
                                           values=load_options, state="readonly", width=8)
         self.load_count_cb.pack(side=tk.LEFT)
-        self.load_count_cb.bind("<<ComboboxSelected>>", lambda e: self._on_max_events_changed())
+        self.load_count_cb.bind("<<ComboboxSelected>>", lambda e: self._schedule_selection(count_changed=True))
 
         # Logs table: prefer LogsTable component, else fallback
         if LogsTable:
@@ -277,10 +730,10 @@ class MainWindow:
                         self.single_explainer.frame.pack(fill=tk.BOTH, expand=True)
             except Exception:
                 logger.exception("Failed to instantiate ExplanationPanel; using Text fallback.")
-                self.single_explainer = scrolledtext.ScrolledText(mid_frame, wrap=tk.WORD, height=20)
+                self.single_explainer = _explainer_text(mid_frame, height=20)
                 self.single_explainer.pack(fill=tk.BOTH, expand=True)
         else:
-            self.single_explainer = scrolledtext.ScrolledText(mid_frame, wrap=tk.WORD, height=20)
+            self.single_explainer = _explainer_text(mid_frame, height=20)
             self.single_explainer.pack(fill=tk.BOTH, expand=True)
 
         single_btn_frame = ttk.Frame(mid_frame)
@@ -289,6 +742,7 @@ class MainWindow:
         self.btn_explain_selected.pack(side=tk.LEFT, padx=4)
         self.btn_explain_and_analyze = ttk.Button(single_btn_frame, text="Explain & Show Analysis", command=self.explain_and_analyze_selected)
         self.btn_explain_and_analyze.pack(side=tk.LEFT, padx=4)
+        self._key_gated_buttons += [self.btn_explain_selected, self.btn_explain_and_analyze]
 
         # RIGHT: Time-range explainer (datetime-based, responsive layout + presets)
         right_frame = ttk.Frame(paned, width=420)
@@ -319,17 +773,23 @@ class MainWindow:
             self.start_date = DateEntry(self.start_ctrl, width=12, date_pattern="yyyy-mm-dd")
             self.start_date.pack(side=tk.LEFT, padx=(0, 6))
         else:
-            self.start_date_text = ttk.Entry(self.start_ctrl, width=14)
+            self._start_date_var = tk.StringVar(self.root)
+            self.start_date_text = ttk.Entry(self.start_ctrl, width=14, textvariable=self._start_date_var)
             self.start_date_text.pack(side=tk.LEFT, padx=(0, 6))
 
-        # Time spinboxes for hour:minute:second (24-hour format)
-        self.start_hour = tk.Spinbox(self.start_ctrl, from_=0, to=23, width=3, format="%02.0f")
+        # Time spinboxes for hour:minute:second (24-hour format). Each is
+        # bound to a StringVar, so setting a field is one Tcl call
+        self._start_time_vars = tuple(tk.StringVar(self.root, value="00") for _ in range(3))
+        self.start_hour = tk.Spinbox(self.start_ctrl, from_=0, to=23, width=3, format="%02.0f",
+                                     textvariable=self._start_time_vars[0])
         self.start_hour.pack(side=tk.LEFT)
         ttk.Label(self.start_ctrl, text=":").pack(side=tk.LEFT)
-        self.start_min = tk.Spinbox(self.start_ctrl, from_=0, to=59, width=3, format="%02.0f")
+        self.start_min = tk.Spinbox(self.start_ctrl, from_=0, to=59, width=3, format="%02.0f",
+                                    textvariable=self._start_time_vars[1])
         self.start_min.pack(side=tk.LEFT)
         ttk.Label(self.start_ctrl, text=":").pack(side=tk.LEFT)
-        self.start_sec = tk.Spinbox(self.start_ctrl, from_=0, to=59, width=3, format="%02.0f")
+        self.start_sec = tk.Spinbox(self.start_ctrl, from_=0, to=59, width=3, format="%02.0f",
+                                    textvariable=self._start_time_vars[2])
         self.start_sec.pack(side=tk.LEFT, padx=(0, 6))
         # removed AM/PM control (24-hour mode)
 
@@ -344,16 +804,21 @@ class MainWindow:
             self.end_date = DateEntry(self.end_ctrl, width=12, date_pattern="yyyy-mm-dd")
             self.end_date.pack(side=tk.LEFT, padx=(0, 6))
         else:
-            self.end_date_text = ttk.Entry(self.end_ctrl, width=14)
+            self._end_date_var = tk.StringVar(self.root)
+            self.end_date_text = ttk.Entry(self.end_ctrl, width=14, textvariable=self._end_date_var)
             self.end_date_text.pack(side=tk.LEFT, padx=(0, 6))
 
-        self.end_hour = tk.Spinbox(self.end_ctrl, from_=0, to=23, width=3, format="%02.0f")
+        self._end_time_vars = tuple(tk.StringVar(self.root, value="00") for _ in range(3))
+        self.end_hour = tk.Spinbox(self.end_ctrl, from_=0, to=23, width=3, format="%02.0f",
+                                   textvariable=self._end_time_vars[0])
         self.end_hour.pack(side=tk.LEFT)
         ttk.Label(self.end_ctrl, text=":").pack(side=tk.LEFT)
-        self.end_min = tk.Spinbox(self.end_ctrl, from_=0, to=59, width=3, format="%02.0f")
+        self.end_min = tk.Spinbox(self.end_ctrl, from_=0, to=59, width=3, format="%02.0f",
+                                  textvariable=self._end_time_vars[1])
         self.end_min.pack(side=tk.LEFT)
         ttk.Label(self.end_ctrl, text=":").pack(side=tk.LEFT)
-        self.end_sec = tk.Spinbox(self.end_ctrl, from_=0, to=59, width=3, format="%02.0f")
+        self.end_sec = tk.Spinbox(self.end_ctrl, from_=0, to=59, width=3, format="%02.0f",
+                                  textvariable=self._end_time_vars[2])
         self.end_sec.pack(side=tk.LEFT, padx=(0, 6))
         # removed AM/PM control (24-hour mode)
 
@@ -361,6 +826,7 @@ class MainWindow:
         # Explain button below entries (always visible)
         self.btn_explain_range = ttk.Button(range_frame, text="Explain Range", command=self.explain_time_range)
         self.btn_explain_range.grid(row=5, column=0, columnspan=2, sticky="w", pady=(4, 0))
+        self._key_gated_buttons.append(self.btn_explain_range)
 
         range_frame.columnconfigure(0, weight=1)
         range_frame.columnconfigure(1, weight=1)
@@ -372,10 +838,10 @@ class MainWindow:
                 self.range_explainer.pack(fill=tk.BOTH, expand=True)
             except Exception:
                 logger.exception("Range ExplanationPanel instantiation failed; using Text fallback.")
-                self.range_explainer = scrolledtext.ScrolledText(right_frame, wrap=tk.WORD, height=12)
+                self.range_explainer = _explainer_text(right_frame, height=12)
                 self.range_explainer.pack(fill=tk.BOTH, expand=True)
         else:
-            self.range_explainer = scrolledtext.ScrolledText(right_frame, wrap=tk.WORD, height=12)
+            self.range_explainer = _explainer_text(right_frame, height=12)
             self.range_explainer.pack(fill=tk.BOTH, expand=True)
 
         # Timeline (optional)
@@ -383,6 +849,7 @@ class MainWindow:
             try:
                 self.timeline = TimelinePanel(right_frame)
                 self.timeline.pack(fill=tk.BOTH, expand=False, pady=(6, 0))
+                self.timeline.set_on_select(self._on_timeline_select)
             except Exception:
                 logger.exception("Failed to instantiate TimelinePanel")
                 self.timeline = None
@@ -401,22 +868,18 @@ class MainWindow:
         # If events were loaded from a user file, do not override them by auto-fetching Windows logs
         if platform.system().lower() == "windows" and read_windows_event_log and not self._loaded_from_file:
             if self._last_loaded_winlog_type != t:
-                try:
-                    logger.info("Loading Windows '%s' event log...", t)
-                    maxrec = self._max_events or 1000
-                    evts = read_windows_event_log(t, max_records=maxrec)
-                    if evts:
-                        if self._max_events:
-                            evts = evts[: self._max_events]
-                        self._loaded_events = evts
-                        self._last_loaded_winlog_type = t
-                    else:
-                        logger.info("Windows '%s' log returned 0 events.", t)
-                except Exception:
-                    logger.exception("Failed to read Windows %s log", t)
+                # Table & timeline are refreshed once the read completes
+                self._start_winlog_read(t)
+                return
+
+        # Whatever is loaded now is what should show; drop any pending read
+        self._winlog_pending = None
+        self._show_loaded_events()
 
-        # For Windows logs we consider loaded_events already appropriate for the type; just set filtered list
-        self._filtered_events = list(self._loaded_events)
+    def _show_loaded_events(self):
+        # For Windows logs we consider loaded_events already appropriate for the type; just set filtered list.
+        # Shared rather than copied: event lists are replaced, never changed in place
+        self._filtered_events = self._loaded_events
 
         # Populate table & timeline
         self._populate_table_and_timeline()
@@ -433,38 +896,66 @@ class MainWindow:
     # Table & timeline population
     # ---------------------------
     def _populate_table_and_timeline(self):
+        self._split_event_columns()
+
         # Logs table
         if self.logs_table:
             try:
-                rows = []
-                for ev in self._filtered_events:
-                    parts = str(ev).split("\t")
-                    timestamp = parts[0] if parts else ""
-                    summary = (str(ev).splitlines()[0])[:120]
-                    rows.append({"timestamp": timestamp, "severity": "", "summary": summary, "raw_event": ev})
-                # prefer component API
-                if hasattr(self.logs_table, "load_rows"):
-                    self.logs_table.load_rows(rows)
-                elif hasattr(self.logs_table, "set_rows"):
-                    self.logs_table.set_rows(rows)
+                # prefer component API; column lists avoid a dict per event
+                if hasattr(self.logs_table, "load_columns"):
+                    self.logs_table.load_columns(
+                        self._event_timestamps, self._event_summaries, self._filtered_events
+                    )
                 else:
-                    try:
+                    rows = [
+                        {"timestamp": timestamp, "severity": "", "summary": summary, "raw_event": ev}
+                        for timestamp, summary, ev in zip(
+                            self._event_timestamps, self._event_summaries, self._filtered_events
+                        )
+                    ]
+                    if hasattr(self.logs_table, "load_rows"):
                         self.logs_table.load_rows(rows)
-                    except Exception:
-                        logger.exception("Failed to load rows into logs_table fallback")
+                    elif hasattr(self.logs_table, "set_rows"):
+                        self.logs_table.set_rows(rows)
+                    else:
+                        try:
+                            self.logs_table.load_rows(rows)
+                        except Exception:
+                            logger.exception("Failed to load rows into logs_table fallback")
             except Exception:
                 logger.exception("Failed to populate logs_table")
         # Timeline population
         if self.timeline:
             try:
                 if hasattr(self.timeline, "load_events"):
-                    self.timeline.load_events(self._filtered_events)
+                    if self._last_loaded_winlog_type:
+                        # Windows Event Log records lead with their timestamp field
+                        self.timeline.load_events(self._filtered_events, timestamps=self._event_timestamps)
+                    else:
+                        self.timeline.load_events(self._filtered_events)
                 elif hasattr(self.timeline, "set_events"):
                     self.timeline.set_events(self._filtered_events)
                 logger.info("Timeline loaded with %d events", len(self._filtered_events))
             except Exception:
                 logger.exception("Failed to populate timeline")
 
+    def _split_event_columns(self):
+        """Split every filtered event once into its timestamp field and summary line."""
+        events = self._filtered_events
+        # Event lists are replaced, never changed in place, so the same list
+        # still has the same columns
+        if events is self._columns_events:
+            return
+        timestamps = []
+        summaries = []
+        for ev in events:
+            timestamp, summary = _event_columns(str(ev))
+            timestamps.append(timestamp)
+            summaries.append(summary)
+        self._event_timestamps = timestamps
+        self._event_summaries = summaries
+        self._columns_events = events
+
     # ---------------------------
     # Timestamp helpers & filtering
     # ---------------------------
@@ -472,97 +963,51 @@ class MainWindow:
         """Try several common datetime formats and return a datetime (naive)."""
         if not s:
             return None
-        s = s.strip()
-        # normalize basic ISO Z and remove stray dots
-        s = s.replace("T", " ").replace("Z", "").replace(".", "")
-        fmts = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M",
-            "%Y-%m-%d",
-            "%m/%d/%Y %I:%M:%S %p",
-            "%m/%d/%Y %I:%M %p",
-            "%m/%d/%Y %H:%M:%S",
-            "%m/%d/%Y %H:%M",
-            "%d-%m-%Y %H:%M:%S",
-            "%d/%m/%Y %I:%M:%S %p",
-            "%d/%m/%Y %I:%M %p",
-            "%H:%M:%S",
-            "%I:%M:%S %p",
-            "%I:%M %p",
-            # Month name formats (English): "Wed Dec 10 16:36:41 2025"
-            "%a %b %d %H:%M:%S %Y",
-            "%b %d %H:%M:%S %Y",
-            "%a %b %d %H:%M:%S",   # without year
-            "%b %d %H:%M:%S",      # without year
-            "%d %b %Y %H:%M:%S",
-            "%d %b %H:%M:%S",
-        ]
-        for fmt in fmts:
-            try:
-                dt = datetime.strptime(s, fmt)
-                return dt
-            except Exception:
-                continue
-        # try to extract iso-like substring
-        iso_re = re.search(r"\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}", s)
-        if iso_re:
-            try:
-                return datetime.fromisoformat(iso_re.group(0).replace("T", " "))
-            except Exception:
-                pass
-        return None
+        return _parse_datetime_text(s)
 
 
     def _extract_event_timestamp(self, event_text: str) -> Optional[datetime]:
         """Attempt to extract a datetime from an event text snippet."""
         if not event_text:
             return None
-        snippet = event_text[:400]  # scan a bit further for verbose lines
-        # Add regex patterns that include month names / weekday names
-        patterns = [
-            r"\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}",
-            r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}",
-            r"\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}(?::\d{2})?\s?(?:AM|PM|am|pm)?",
-            r"\d{1,2}-\d{1,2}-\d{4} \d{2}:\d{2}:\d{2}",
-            r"^\d{2}:\d{2}:\d{2}",
-            # weekday + month name e.g. "Wed Dec 10 16:36:41 2025"
-            r"[A-Za-z]{3}\s+[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}\s+\d{4}",
-            # month name e.g. "Dec 10 16:36:41 2025" or "Dec 10 16:36:41"
-            r"[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}(?:\s+\d{4})?",
-            # day month year format e.g. "10 Dec 2025 16:36:41"
-            r"\d{1,2}\s+[A-Za-z]{3}\s+\d{4}\s+\d{2}:\d{2}:\d{2}",
-        ]
-        for p in patterns:
-            m = re.search(p, snippet)
-            if m:
-                candidate = m.group(0)
-                dt = self._try_parse_datetime(candidate)
-                if dt:
-                    return dt
-        # last-resort token scan
-        tokens = re.split(r"\s+", snippet)
-        for t in tokens:
-            dt = self._try_parse_datetime(t)
-            if dt:
-                return dt
-        return None
-
-
-    def _filter_events_by_time(self, start_dt: Optional[datetime], end_dt: Optional[datetime]) -> List[str]:
-        matched = []
-        for ev in self._filtered_events:
-            try:
-                ev_dt = self._extract_event_timestamp(ev)
-                if not ev_dt:
-                    continue
-                if start_dt and ev_dt < start_dt:
-                    continue
-                if end_dt and ev_dt > end_dt:
+        return _event_timestamp(event_text)
+
+
+    def _event_time_index(self) -> Tuple[List[datetime], List[int]]:
+        """(sorted timestamps, event positions) for the filtered events with a parsable timestamp, cached."""
+        events = self._filtered_events
+        index = self._time_index
+        # Re-showing the loaded events reuses the same list; a re-read of a
+        # log returns equal events in a fresh one. Comparing the lists
+        # (element identity first) keeps the index valid across both and
+        # rebuilds it only for new events
+        if index is None or (index[0] is not events and index[0] != events):
+            timed = []
+            for i, ev in enumerate(events):
+                try:
+                    ev_dt = self._extract_event_timestamp(ev)
+                except Exception:
                     continue
-                matched.append(ev)
-            except Exception:
-                continue
-        return matched
+                if ev_dt:
+                    timed.append((ev_dt, i))
+            timed.sort()
+            index = self._time_index = (events, [dt for dt, _ in timed], [i for _, i in timed])
+        return index[1], index[2]
+
+    def _positions_in_range(self, start_dt: Optional[datetime], end_dt: Optional[datetime]) -> List[int]:
+        """Positions in _filtered_events (in timestamp order) of the events within the range.
+
+        May return the cached index list itself, so callers must not modify it.
+        """
+        dts, positions = self._event_time_index()
+        if dts and (start_dt is None or start_dt <= dts[0]) and (end_dt is None or end_dt >= dts[-1]):
+            # The range covers every timestamped event (e.g. "Last 1 hour" over a
+            # 15-minute log), so there is nothing to search or slice
+            return positions
+        # Binary-search the range ends; open ends take everything on that side
+        lo = bisect_left(dts, start_dt) if start_dt else 0
+        hi = bisect_right(dts, end_dt) if end_dt else len(dts)
+        return positions[lo:hi]
 
     # ---------------------------
     # Selection helpers & explainers (logs_table is primary)
@@ -590,19 +1035,15 @@ class MainWindow:
         if not ev:
             messagebox.showwarning("No event", "No event selected.")
             return
-        try:
-            explanation = get_explanation(self.gemini, ev, context=None, retries=1)
-            if isinstance(self.single_explainer, tk.Text):
-                self.single_explainer.delete(1.0, tk.END)
-                self.single_explainer.insert(tk.END, explanation)
-            else:
-                try:
-                    self.single_explainer.set_text(explanation)
-                except Exception:
-                    logger.exception("Failed to set text in ExplanationPanel")
-        except Exception as exc:
-            logger.exception("Explain failed: %s", exc)
-            messagebox.showerror("Gemini Error", str(exc))
+        # Repeats are answered from the explanation cache without a round trip
+        cached = get_cached_explanation(self.gemini, ev, context=None)
+        if cached is not None:
+            self._show_explanation(self.single_explainer, cached)
+            return
+        self._submit_explanation(
+            self.single_explainer, "Explain failed", "{}",
+            get_explanation, self.gemini, ev, context=None, retries=1,
+        )
 
     def explain_and_analyze_selected(self):
         ev = self._get_selected_event_text()
@@ -614,17 +1055,71 @@ class MainWindow:
         except Exception:
             logger.exception("Local analysis failed")
             analysis = "Local analysis error"
+        self._submit_explanation(
+            self.single_explainer, "Explain failed", "{}",
+            self._analysis_report, self.gemini, ev, analysis,
+        )
+
+    @staticmethod
+    def _analysis_report(gemini: Optional[GeminiClient], ev: str, analysis) -> str:
+        """Runs on a Gemini worker: local analysis plus the Gemini explanation, as one text."""
         try:
-            explanation = get_explanation(self.gemini, ev, context={"analysis": analysis}, retries=1) if self.gemini else "No Gemini key"
+            explanation = get_explanation(gemini, ev, context={"analysis": analysis}, retries=1) if gemini else "No Gemini key"
         except Exception as exc:
             explanation = f"Failed to get explanation: {exc}"
-        output = f"=== Local Analysis ===\n{analysis}\n\n=== Gemini Explanation ===\n{explanation}"
-        if isinstance(self.single_explainer, tk.Text):
-            self.single_explainer.delete(1.0, tk.END)
-            self.single_explainer.insert(tk.END, output)
+        return f"=== Local Analysis ===\n{analysis}\n\n=== Gemini Explanation ===\n{explanation}"
+
+    # ---------------------------
+    # Background Gemini requests
+    # ---------------------------
+    def _submit_explanation(self, panel, log_message: str, error_template: str, fn, *args, **kwargs):
+        """
+        Run fn(*args, **kwargs) on a Gemini worker and show the text it
+        returns in `panel`. A failure is logged with `log_message` and shown
+        as `error_template` formatted with the exception. Submitting again
+        for the same panel supersedes the earlier request.
+        """
+        previous = self._active_explanations.get(panel)
+        if previous is not None:
+            previous.cancel()  # no-op once running; its result is then ignored
+        future = _run_in_background(self._gemini_slots, "gemini", fn, *args, **kwargs)
+        self._active_explanations[panel] = future
+        self.root.after(_POLL_MS, self._finish_explanation, future, panel, log_message, error_template)
+
+    def _finish_explanation(self, future: Future, panel, log_message: str, error_template: str):
+        if not future.done():
+            self.root.after(_POLL_MS, self._finish_explanation, future, panel, log_message, error_template)
+            return
+        if self._active_explanations.get(panel) is not future:
+            return  # superseded by a newer request
+        del self._active_explanations[panel]
+
+        try:
+            text = future.result()
+        except Exception as exc:
+            logger.exception("%s: %s", log_message, exc)
+            messagebox.showerror("Gemini Error", error_template.format(exc))
+            return
+        self._set_panel_text(panel, text)
+
+    def _show_explanation(self, panel, text: str):
+        """Show `text` in `panel` now, superseding any request still running for it."""
+        previous = self._active_explanations.pop(panel, None)
+        if previous is not None:
+            previous.cancel()
+        self._set_panel_text(panel, text)
+
+    def _set_panel_text(self, panel, text: str):
+        """Replace the contents of an explainer panel (ExplanationPanel or plain Text)."""
+        if isinstance(panel, tk.Text):
+            # One Tk call (and one relayout) instead of delete + insert;
+            # the widget is read-only apart from this
+            panel.configure(state=tk.NORMAL)
+            panel.replace("1.0", tk.END, text)
+            panel.configure(state=tk.DISABLED)
         else:
             try:
-                self.single_explainer.set_text(output)
+                panel.set_text(text)
             except Exception:
                 logger.exception("Failed to set text in ExplanationPanel")
 
@@ -648,14 +1143,9 @@ class MainWindow:
             if DateEntry and hasattr(self, "start_date"):
                 self.start_date.set_date(start_dt.date())
             elif hasattr(self, "start_date_text"):
-                self.start_date_text.delete(0, tk.END)
-                self.start_date_text.insert(0, date_str)
-            self.start_hour.delete(0, tk.END)
-            self.start_hour.insert(0, h)
-            self.start_min.delete(0, tk.END)
-            self.start_min.insert(0, m)
-            self.start_sec.delete(0, tk.END)
-            self.start_sec.insert(0, s)
+                self._start_date_var.set(date_str)
+            for var, value in zip(self._start_time_vars, (h, m, s)):
+                var.set(value)
         except Exception:
             logger.exception("Failed to set start time widgets")
 
@@ -668,14 +1158,9 @@ class MainWindow:
             if DateEntry and hasattr(self, "end_date"):
                 self.end_date.set_date(end_dt.date())
             elif hasattr(self, "end_date_text"):
-                self.end_date_text.delete(0, tk.END)
-                self.end_date_text.insert(0, date_str)
-            self.end_hour.delete(0, tk.END)
-            self.end_hour.insert(0, h)
-            self.end_min.delete(0, tk.END)
-            self.end_min.insert(0, m)
-            self.end_sec.delete(0, tk.END)
-            self.end_sec.insert(0, s)
+                self._end_date_var.set(date_str)
+            for var, value in zip(self._end_time_vars, (h, m, s)):
+                var.set(value)
         except Exception:
             logger.exception("Failed to set end time widgets")
 
@@ -686,12 +1171,11 @@ class MainWindow:
             if DateEntry and hasattr(self, "start_date"):
                 date_val = self.start_date.get_date().strftime("%Y-%m-%d")
             elif hasattr(self, "start_date_text"):
-                date_val = self.start_date_text.get().strip()
+                date_val = self._start_date_var.get().strip()
             else:
                 date_val = ""
-            h = self.start_hour.get().strip() or "00"
-            mi = self.start_min.get().strip() or "00"
-            s = self.start_sec.get().strip() or "00"
+            h, mi, s = (var.get().strip() for var in self._start_time_vars)
+            h, mi, s = h or "00", mi or "00", s or "00"
             start_str = f"{date_val} {h}:{mi}:{s}"
             start_dt = self._try_parse_datetime(start_str)
         except Exception:
@@ -702,12 +1186,11 @@ class MainWindow:
             if DateEntry and hasattr(self, "end_date"):
                 date_val = self.end_date.get_date().strftime("%Y-%m-%d")
             elif hasattr(self, "end_date_text"):
-                date_val = self.end_date_text.get().strip()
+                date_val = self._end_date_var.get().strip()
             else:
                 date_val = ""
-            h = self.end_hour.get().strip() or "23"
-            mi = self.end_min.get().strip() or "59"
-            s = self.end_sec.get().strip() or "59"
+            h, mi, s = (var.get().strip() for var in self._end_time_vars)
+            h, mi, s = h or "23", mi or "59", s or "59"
             end_str = f"{date_val} {h}:{mi}:{s}"
             end_dt = self._try_parse_datetime(end_str)
         except Exception:
@@ -743,43 +1226,47 @@ class MainWindow:
 
         self._set_time_widgets(start, end)
 
+    def _validate_range(self) -> Tuple[Optional[datetime], Optional[datetime], Optional[Tuple[str, str]]]:
+        """Read the time widgets; returns (start, end, None) or the first (title, message) error."""
+        start_dt, end_dt = self._read_time_widgets()
+        err = None
+        if start_dt is None and (hasattr(self, "start_date_text") or DateEntry):
+            err = ("Invalid start time", "Could not parse the Start time. Use the date picker + time fields.")
+        elif end_dt is None and (hasattr(self, "end_date_text") or DateEntry):
+            err = ("Invalid end time", "Could not parse the End time. Use the date picker + time fields.")
+        elif start_dt and end_dt and start_dt > end_dt:
+            err = ("Invalid range", "Start time must be <= End time.")
+        return start_dt, end_dt, err
+
     def explain_time_range(self):
         if not self.gemini:
             messagebox.showerror("Gemini Missing", "Gemini API client not initialized.")
             return
 
-        start_dt, end_dt = self._read_time_widgets()
-
-        if start_dt is None and (hasattr(self, "start_date_text") or DateEntry):
-            messagebox.showerror("Invalid start time", "Could not parse the Start time. Use the date picker + time fields.")
-            return
-        if end_dt is None and (hasattr(self, "end_date_text") or DateEntry):
-            messagebox.showerror("Invalid end time", "Could not parse the End time. Use the date picker + time fields.")
-            return
-
-        if start_dt and end_dt and start_dt > end_dt:
-            messagebox.showerror("Invalid range", "Start time must be <= End time.")
+        start_dt, end_dt, err = self._validate_range()
+        if err:
+            messagebox.showerror(*err)
             return
 
-        selected_events = self._filter_events_by_time(start_dt, end_dt)
-        if not selected_events:
+        positions = self._positions_in_range(start_dt, end_dt)
+        if not positions:
             messagebox.showinfo("No events", "No events found in that time range.")
             return
 
-        prompt_body = "\n\n".join(selected_events[:20])  # cap size
-        try:
-            explanation = get_explanation(self.gemini, prompt_body, context={"range_count": len(selected_events)}, retries=1)
-            if isinstance(self.range_explainer, tk.Text):
-                self.range_explainer.delete(1.0, tk.END)
-                self.range_explainer.insert(tk.END, explanation)
-            else:
-                try:
-                    self.range_explainer.set_text(explanation)
-                except Exception:
-                    logger.exception("Failed to set text in Range ExplanationPanel")
-        except Exception as exc:
-            logger.exception("Failed to get range explanation: %s", exc)
-            messagebox.showerror("Gemini Error", f"Failed to get range explanation: {exc}")
+        # Only the first 20 in log order go into the prompt (cap size), so
+        # pick just those rather than ordering the whole range
+        events = self._filtered_events
+        # (str.join builds a list from any iterable first, so hand it one)
+        prompt_body = "\n\n".join([events[i] for i in heapq.nsmallest(20, positions)])
+        context = {"range_count": len(positions)}
+        cached = get_cached_explanation(self.gemini, prompt_body, context=context)
+        if cached is not None:
+            self._show_explanation(self.range_explainer, cached)
+            return
+        self._submit_explanation(
+            self.range_explainer, "Failed to get range explanation", "Failed to get range explanation: {}",
+            get_explanation, self.gemini, prompt_body, context=context, retries=1,
+        )
 
     # ---------------------------
     # File open + load (user files)
@@ -799,11 +1286,35 @@ class MainWindow:
             messagebox.showerror("Error", f"Failed to open file: {path}")
 
     def _load_file(self, path: str):
+        # Read + parse on a worker; the UI is updated once it is done
+        future = _run_in_background(self._io_slots, "log-io", self._read_and_parse, path, self._max_events)
+        self.root.after(_POLL_MS, self._on_file_loaded, future, path)
+
+    @staticmethod
+    def _read_and_parse(path: str, max_events: Optional[int]) -> List[str]:
+        """Runs on an I/O worker; must not touch any widget."""
+        raw = load_file(path)
+        # Only the first max_events are kept, so parsing can stop there
+        events = parse_log(raw, limit=max_events)
+        return events if events is not None else []
+
+    @staticmethod
+    def _save_last_opened(path: str):
+        """Runs on the settings worker: remember the file for next time."""
+        try:
+            cfg = load_config() or {}
+            cfg["last_opened"] = path
+            save_app_settings(cfg)
+        except Exception:
+            logger.exception("Failed to persist last_opened to app_settings.json")
+
+    def _on_file_loaded(self, future: Future, path: str):
+        if not future.done():
+            self.root.after(_POLL_MS, self._on_file_loaded, future, path)
+            return
+
         try:
-            raw = load_file(path)
-            events = parse_log(raw)
-            if events is None:
-                events = []
+            events = future.result()
             # Limit to configured max (unless All)
             if self._max_events:
                 events = events[: self._max_events]
@@ -813,12 +1324,7 @@ class MainWindow:
             # Apply current filter (dropdown) to user-loaded events
             self._apply_log_type_filter()
             logger.info("Loaded %d events from file %s", len(events), path)
-            try:
-                cfg = load_config() or {}
-                cfg["last_opened"] = path
-                save_app_settings(cfg)
-            except Exception:
-                logger.exception("Failed to persist last_opened to app_settings.json")
+            self._settings_pool.submit(self._save_last_opened, path)
         except FileNotFoundError:
             logger.exception("File not found: %s", path)
             messagebox.showerror("File not found", f"File not found: {path}")
@@ -830,11 +1336,8 @@ class MainWindow:
     # Settings & API key handling
     # ---------------------------
     def open_settings_dialog(self):
-        try:
-            from src.ui.settings_dialog import SettingsDialog
-        except Exception as exc:
-            logger.exception("Failed to import SettingsDialog: %s", exc)
-            messagebox.showerror("Error", f"Cannot open settings dialog: {exc}")
+        if SettingsDialog is None:
+            messagebox.showerror("Error", "Cannot open settings dialog: it failed to load (see log).")
             return
         dialog = SettingsDialog(self.root, on_save_callback=self._on_api_key_changed)
         dialog.grab_set()
@@ -847,8 +1350,11 @@ class MainWindow:
                 self._update_ui_state_on_key()
                 return
             try:
-                self.gemini = GeminiClient(api_key=new_key)
-                logger.info("Gemini client initialized dynamically from Settings.")
+                # Re-saving the same key keeps the current client, along with
+                # its open connections and the explanations cached for it
+                if getattr(self.gemini, "api_key", None) != new_key:
+                    self.gemini = GeminiClient(api_key=new_key)
+                    logger.info("Gemini client initialized dynamically from Settings.")
                 messagebox.showinfo("Gemini Ready", "Gemini API key saved. Analysis/Explanation features are now enabled.")
             except Exception as exc:
                 logger.exception("Failed to initialize Gemini client with new key: %s", exc)
@@ -864,14 +1370,10 @@ class MainWindow:
     # UI state updates
     # ---------------------------
     def _update_ui_state_on_key(self):
-        has_key = bool(self.gemini)
+        state = "normal" if self.gemini else "disabled"
         try:
-            if hasattr(self, "btn_explain_selected") and self.btn_explain_selected:
-                self.btn_explain_selected.config(state="normal" if has_key else "disabled")
-            if hasattr(self, "btn_explain_and_analyze") and self.btn_explain_and_analyze:
-                self.btn_explain_and_analyze.config(state="normal" if has_key else "disabled")
-            if hasattr(self, "btn_explain_range") and self.btn_explain_range:
-                self.btn_explain_range.config(state="normal" if has_key else "disabled")
+            for button in self._key_gated_buttons:
+                button.config(state=state)
         except Exception:
             logger.exception("Failed to update button states in _update_ui_state_on_key")
 
@@ -898,22 +1400,37 @@ class MainWindow:
         if row and "raw_event" in row:
             try:
                 # Show in single explainer and auto-explain
-                if isinstance(self.single_explainer, tk.Text):
-                    self.single_explainer.delete(1.0, tk.END)
-                    self.single_explainer.insert(tk.END, row["raw_event"])
-                else:
-                    try:
-                        self.single_explainer.set_text(row["raw_event"])
-                    except Exception:
-                        logger.exception("Failed to set text in ExplanationPanel")
+                self._set_panel_text(self.single_explainer, row["raw_event"])
                 if self.gemini:
                     self.explain_selected_event()
             except Exception:
                 logger.exception("Failed in table double-click handler")
 
+    def _on_timeline_select(self, event_text: str):
+        # Timeline rows show only the event's first line; a click shows all of it
+        try:
+            self._set_panel_text(self.single_explainer, event_text)
+        except Exception:
+            logger.exception("Failed in timeline select handler")
+
     # ---------------------------
     # New: handle changes to Load dropdown
     # ---------------------------
+    def _schedule_selection(self, count_changed: bool = False):
+        """Debounce combobox changes: only the last one within the delay is applied."""
+        self._count_changed = self._count_changed or count_changed
+        if self._select_after_id is not None:
+            self.root.after_cancel(self._select_after_id)
+        self._select_after_id = self.root.after(_SELECT_DEBOUNCE_MS, self._apply_selection)
+
+    def _apply_selection(self):
+        self._select_after_id = None
+        if self._count_changed:
+            self._count_changed = False
+            self._on_max_events_changed()  # re-applies the log type filter too
+        else:
+            self._apply_log_type_filter()
+
     def _on_max_events_changed(self):
         """Callback when user changes the 'Load' dropdown."""
         v = (self.load_count_var.get() or "").strip()
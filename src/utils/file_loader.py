@@ -14,8 +14,13 @@ Functions:
 """
 
 import os
+import stat
 from src.main.logger import logger
 
+# Below this size the file is decoded as strict UTF-8 with newlines
+# normalised, as reading it in text mode would; larger files keep theirs
+_TEXT_MODE_LIMIT = 4 * 1024 * 1024
+
 
 def file_exists(path: str) -> bool:
     """Return True if file exists and is a regular file."""
@@ -38,37 +43,38 @@ def load_file(path: str) -> str:
     Raises:
         FileNotFoundError, PermissionError, OSError (propagated)
     """
-    if not file_exists(path):
+    # One stat answers both "is it a regular file" and "how big is it"
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise FileNotFoundError(f"File not found: {path}")
+    size = st.st_size
+
+    logger.debug("Loading file '%s' (%d bytes)", path, size)
 
+    # Read the bytes once; every decode below works on this buffer, so a
+    # failed UTF-8 attempt no longer means reading the file a second time
     try:
-        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            data = f.read()
     except Exception as exc:
-        logger.exception("Could not get file size for '%s': %s", path, exc)
+        logger.error("Failed to read file as bytes '%s': %s", path, exc)
         raise
 
-    logger.debug("Loading file '%s' (%d bytes)", path, size)
-
-    # For small files, attempt text mode first for performance/readability
-    if size < 4 * 1024 * 1024:  # <4MB
+    # For small files, decode as text mode would (strict UTF-8, universal newlines)
+    if size < _TEXT_MODE_LIMIT:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return f.read()
+            text = data.decode("utf-8")
         except UnicodeDecodeError:
             logger.info("UTF-8 decode failed for '%s' when reading as text; falling back to binary decode.", path)
-        except Exception as exc:
-            logger.error("Failed to read file as text '%s': %s", path, exc)
-            raise
+        else:
+            return text.replace("\r\n", "\n").replace("\r", "\n")
 
-    # Fallback: read as bytes and decode to text (always return str)
+    # Fallback: decode the bytes to text (always return str)
     try:
-        with open(path, "rb") as f:
-            data = f.read()
-            try:
-                return data.decode("utf-8")
-            except Exception:
-                # Last resort: decode with replacement characters to avoid raising
-                return data.decode("utf-8", errors="replace")
-    except Exception as exc:
-        logger.error("Failed to read file as bytes '%s': %s", path, exc)
-        raise
+        return data.decode("utf-8")
+    except Exception:
+        # Last resort: decode with replacement characters to avoid raising
+        return data.decode("utf-8", errors="replace")
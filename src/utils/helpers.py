@@ -8,6 +8,7 @@ Useful utilities:
 - now_iso()                       -> current ISO timestamp
 - safe_write_json(path, obj)      -> atomically write JSON (returns True/False)
 - safe_load_json(path, default)   -> load JSON with graceful fallback
+- json_loads(data)                -> decode JSON text/bytes (orjson when available)
 - chunk_text(text, size)          -> split text into chunks <= size (word-safe)
 - truncate(text, max_len)         -> safely truncate with ellipsis
 - ensure_list(obj)                -> coerce to list
@@ -23,6 +24,19 @@ from datetime import datetime
 
 from src.main.logger import logger
 
+# Optional fast JSON decoder; stdlib json is used when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: str | bytes | bytearray) -> Any:
+    """Decode a JSON document from text or raw bytes (uses orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def pretty_print(obj: Any, compact: bool = False) -> None:
     """Pretty-print an object to stdout (for debugging)."""
@@ -76,8 +90,7 @@ def safe_load_json(path: str | Path, default: Optional[Any] = None) -> Any:
     if not p.exists():
         return default
     try:
-        with open(p, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return json_loads(p.read_bytes())
     except Exception as exc:
         logger.warning("Failed to load JSON from %s: %s", p, exc)
         return default
@@ -3,7 +3,7 @@
 Log parser utilities for Win Log Interpreter (Gemini-only).
 
 Primary function:
-- parse_log(raw: str | bytes) -> list[str]
+- parse_log(raw: str | bytes, limit: int | None = None) -> list[str]
 
 Behavior:
 - Accepts raw text (or bytes) containing one or many events.
@@ -21,7 +21,8 @@ Notes:
   may further normalize or enrich the events.
 """
 
-from typing import List
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
 import re
 import xml.etree.ElementTree as ET
 
@@ -38,6 +39,19 @@ _TIMESTAMP_PATTERNS = [
 ]
 _TIMESTAMP_RE = re.compile("|".join([f"({p})" for p in _TIMESTAMP_PATTERNS]), re.IGNORECASE | re.MULTILINE)
 
+# Every line boundary str.splitlines() recognises ("\r\n" counts as one)
+_LINE_BREAK_RE = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Lazily yield the same lines as text.splitlines()."""
+    pos = 0
+    for m in _LINE_BREAK_RE.finditer(text):
+        yield text[pos:m.start()]
+        pos = m.end()
+    if pos < len(text):
+        yield text[pos:]
+
 
 def _is_xml_like(text: str) -> bool:
     """Quick heuristic to detect XML-like event exports."""
@@ -99,7 +113,15 @@ def _split_by_timestamp(lines: List[str]) -> List[str]:
     Whenever a line begins with a timestamp pattern, treat it as a new event.
     Otherwise, append to current event (allowing multiline events).
     """
-    events = []
+    return list(_iter_timestamp_groups(lines))
+
+
+def _clean_event(ev: str) -> str:
+    return re.sub(r"\s+\n", "\n", ev).strip()
+
+
+def _iter_timestamp_groups(lines: Iterable[str]) -> Iterator[str]:
+    """Generator behind _split_by_timestamp: yields each cleaned event as soon as it is complete."""
     current = []
 
     for line in lines:
@@ -113,7 +135,10 @@ def _split_by_timestamp(lines: List[str]) -> List[str]:
         if _TIMESTAMP_RE.search(line[:50] if len(line) > 50 else line):
             # Start of a new event if current exists
             if current:
-                events.append("\n".join(current).strip())
+                ev = "\n".join(current).strip()
+                # Post-process: collapse excessive whitespace
+                if ev:
+                    yield _clean_event(ev)
                 current = [line.rstrip()]
             else:
                 current = [line.rstrip()]
@@ -122,18 +147,19 @@ def _split_by_timestamp(lines: List[str]) -> List[str]:
             current.append(line.rstrip())
 
     if current:
-        events.append("\n".join(current).strip())
+        ev = "\n".join(current).strip()
+        if ev:
+            yield _clean_event(ev)
 
-    # Post-process: collapse excessive whitespace
-    return [re.sub(r"\s+\n", "\n", ev).strip() for ev in events if ev and ev.strip()]
 
-
-def parse_log(raw: str | bytes) -> List[str]:
+def parse_log(raw: str | bytes, limit: Optional[int] = None) -> List[str]:
     """
     Parse raw log content into a list of event strings.
 
     Args:
         raw: raw content (text or bytes) of a log file or an exported XML string.
+        limit: if given, return at most this many events; the same as slicing
+            the full result, but line-based parsing stops once it has them.
 
     Returns:
         List[str]: list of parsed events (each is a cleaned string).
@@ -162,27 +188,33 @@ def parse_log(raw: str | bytes) -> List[str]:
     if _is_xml_like(text):
         events = _extract_events_from_xml(text)
         if events:
-            return events
+            return events[:limit]
+
+    # With a limit, lines are produced lazily and grouping stops early: two
+    # events are enough to settle on timestamp grouping, and no more than
+    # `limit` are kept
+    def lines():
+        return text.splitlines() if limit is None else _iter_lines(text)
 
     # 2) If the file is plain text, attempt timestamp-based grouping
     # First, split into lines and try timestamp grouping
-    lines = text.splitlines()
-    ts_grouped = _split_by_timestamp(lines)
+    wanted = None if limit is None else max(limit, 2)
+    ts_grouped = list(islice(_iter_timestamp_groups(lines()), wanted))
     if len(ts_grouped) >= 2:
-        return ts_grouped
+        return ts_grouped[:limit]
 
     # 3) If timestamp grouping didn't produce multiple events, try blank-line split
     blank_split = _split_by_blank_lines(text)
     if len(blank_split) >= 2:
-        return blank_split
+        return blank_split[:limit]
 
     # 4) Fallback: treat each non-empty line as an event
-    simple_lines = [ln.strip() for ln in lines if ln.strip()]
+    simple_lines = list(islice((ln.strip() for ln in lines() if ln.strip()), limit))
     if simple_lines:
         return simple_lines
 
     # 5) Final fallback: return the whole content as a single event
-    return [text]
+    return [text][:limit]
 
 
 # Utility: a simple summarizer that reduces long events to a one-line preview
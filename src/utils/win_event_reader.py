@@ -11,6 +11,8 @@ Provides:
 
 Returned event string format (single-line summary suitable for UI):
     "<timestamp>\t<source>\tID:<event_id>\tType:<event_type>\t<message preview>"
+where <timestamp> is ISO-style ("YYYY-MM-DD HH:MM:SS" from pywin32, wevtutil's
+own "YYYY-MM-DDTHH:MM:SS..." otherwise), which the UI parses without guessing.
 
 Notes:
 - Reading the Security log often requires elevated privileges.
@@ -44,10 +46,15 @@ except Exception:
     _win32evtlog = None
 
 
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
 def _format_win32_event(evt) -> str:
     """Format a pywin32 EventLogRecord into a single-line string."""
     try:
-        time = evt.TimeGenerated.Format() if hasattr(evt, "TimeGenerated") else ""
+        # ISO rather than Format()'s locale-dependent default: it sorts as
+        # text and the UI reads it back with datetime.fromisoformat
+        time = evt.TimeGenerated.Format(_TIME_FORMAT) if hasattr(evt, "TimeGenerated") else ""
     except Exception:
         time = str(getattr(evt, "TimeGenerated", ""))
 
@@ -189,8 +196,11 @@ def _read_with_wevtutil(log_type: str, max_records: int) -> List[str]:
             return events
         # Blocks are separated by two or more newlines; normalize line endings
         normalized = out.replace("\r\n", "\n").replace("\r", "\n")
-        blocks = [b.strip() for b in normalized.split("\n\n") if b.strip()]
-        for block in blocks[:max_records]:
+        # Parse blocks as they come and stop once we have enough (blank
+        # blocks parse to None and are skipped)
+        for block in normalized.split("\n\n"):
+            if len(events) >= max_records:
+                break
             parsed = _parse_wevtutil_output_block(block)
             if parsed:
                 events.append(parsed)
@@ -4,15 +4,23 @@ Tests for ai_explainer module.
 """
 
 import unittest
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 from src.api.ai_explainer import (
     build_explain_prompt,
     parse_gemini_response,
     get_explanation,
+    get_explanations,
+    get_cached_explanation,
+    clear_explanation_cache,
 )
 
 
 class TestAIExplainer(unittest.TestCase):
+    def setUp(self):
+        clear_explanation_cache()
+
     def test_build_explain_prompt_contains_event_and_instructions(self):
         event = "Service failed to start: timeout"
         context = {"source": "server1", "timestamp": "2025-01-01 12:00:00", "related_events": ["ev1", "ev2", "ev3", "ev4"]}
@@ -50,6 +58,14 @@ class TestAIExplainer(unittest.TestCase):
         resp6 = {"weird": 123}
         self.assertIn("123", parse_gemini_response(resp6))
 
+    def test_parse_gemini_response_candidates_shape(self):
+        resp = {"candidates": [{"content": {"parts": [{"text": "  Gemini text  "}]}}]}
+        self.assertEqual(parse_gemini_response(resp), "Gemini text")
+
+        # Non-text parts still go through the tolerant path
+        resp = {"candidates": [{"content": {"parts": ["Part string"]}}]}
+        self.assertEqual(parse_gemini_response(resp), "Part string")
+
     def test_parse_gemini_response_raises_on_empty(self):
         with self.assertRaises(ValueError):
             parse_gemini_response(None)
@@ -81,6 +97,61 @@ class TestAIExplainer(unittest.TestCase):
         explanation = get_explanation(fake_client, "Some event", retries=0)
         self.assertEqual(explanation, "Explained text")
 
+    def test_get_explanation_serves_repeats_from_cache(self):
+        fake_client = MagicMock()
+        fake_client.chat.return_value = "Cached explanation"
+
+        first = get_explanation(fake_client, "Repeated event", retries=0)
+        second = get_explanation(fake_client, "Repeated event", retries=0)
+        self.assertEqual(first, second)
+        self.assertEqual(fake_client.chat.call_count, 1)
+
+        get_explanation(fake_client, "Repeated event", retries=0, use_cache=False)
+        self.assertEqual(fake_client.chat.call_count, 2)
+
+    def test_get_cached_explanation_never_calls_client(self):
+        fake_client = MagicMock()
+        fake_client.chat.return_value = "Known explanation"
+
+        self.assertIsNone(get_cached_explanation(fake_client, "Some event"))
+        get_explanation(fake_client, "Some event", retries=0)
+        self.assertEqual(get_cached_explanation(fake_client, "Some event"), "Known explanation")
+        self.assertIsNone(get_cached_explanation(fake_client, "Some event", context={"k": "v"}))
+        self.assertEqual(fake_client.chat.call_count, 1)
+
+    def test_cache_is_keyed_on_endpoint_not_client_object(self):
+        class FakeClient:
+            base_url = "https://example.invalid"
+            model = "models/test"
+
+            def chat(self, prompt):
+                return "Shared explanation"
+
+        client = FakeClient()
+        get_explanation(client, "Some event", retries=0)
+        client_ref = weakref.ref(client)
+        del client
+        self.assertIsNone(client_ref())
+        self.assertEqual(get_cached_explanation(FakeClient(), "Some event"), "Shared explanation")
+
+    def test_get_explanations_keeps_order_and_skips_duplicates(self):
+        fake_client = MagicMock()
+        fake_client.chat.side_effect = lambda prompt: "About A" if "event A" in prompt else "About B"
+
+        result = get_explanations(fake_client, ["event A", "event B", "event A"], retries=0)
+        self.assertEqual(result, ["About A", "About B", "About A"])
+        self.assertEqual(fake_client.chat.call_count, 2)
+        self.assertEqual(get_explanations(fake_client, []), [])
+
+    @patch("src.api.ai_explainer.ThreadPoolExecutor", wraps=ThreadPoolExecutor)
+    def test_get_explanations_caps_workers_at_client_pool_size(self, pool_cls):
+        fake_client = MagicMock()
+        fake_client.max_connections = 2
+        fake_client.chat.side_effect = lambda prompt: "Explained"
+
+        get_explanations(fake_client, ["e1", "e2", "e3", "e4"], retries=0, max_workers=8)
+        self.assertEqual(pool_cls.call_args.kwargs["max_workers"], 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@
 Tests for GeminiClient (Gemini-only)
 """
 
+import json
 import unittest
 from unittest.mock import patch, MagicMock
 from src.api.api_client_gemini import GeminiClient, GeminiAPIError
@@ -10,27 +11,26 @@ from src.api.api_client_gemini import GeminiClient, GeminiAPIError
 
 class TestGeminiClient(unittest.TestCase):
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_chat_success(self, mock_post):
-        # Mock successful JSON response
+        # Mock successful generateContent response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"reply": "Hello world"}
+        mock_response.content = b'{"candidates": [{"content": {"parts": [{"text": "Hello world"}]}}]}'
         mock_post.return_value = mock_response
 
         client = GeminiClient(api_key="1234567890ABCDEF")
         result = client.chat("test prompt")
 
-        self.assertEqual(result["reply"], "Hello world")
+        self.assertEqual(result, "Hello world")
 
         # Check that POST was called correctly
         mock_post.assert_called_once()
         args, kwargs = mock_post.call_args
-        self.assertIn("/v1/chat", args[0])
-        self.assertIn("Authorization", kwargs["headers"])
-        self.assertEqual(kwargs["headers"]["Authorization"], "Bearer 1234567890ABCDEF")
+        self.assertIn(":generateContent", args[0])
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_chat_error_status_code(self, mock_post):
         # Mock 400 error response
         mock_response = MagicMock()
@@ -43,12 +43,12 @@ class TestGeminiClient(unittest.TestCase):
         with self.assertRaises(GeminiAPIError):
             client.chat("test prompt")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_chat_invalid_json(self, mock_post):
         # Mock response with invalid JSON
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"not json"
         mock_post.return_value = mock_response
 
         client = GeminiClient(api_key="1234567890ABCDEF")
@@ -56,6 +56,42 @@ class TestGeminiClient(unittest.TestCase):
         with self.assertRaises(GeminiAPIError):
             client.chat("test prompt")
 
+    @patch("requests.Session.post")
+    def test_chat_batch_preserves_order(self, mock_post):
+        def fake_post(url, data=None, headers=None, timeout=None):
+            resp = MagicMock()
+            resp.status_code = 200
+            text = json.loads(data)["contents"][0]["parts"][0]["text"]
+            resp.content = b'{"candidates": [{"content": {"parts": [{"text": "%s"}]}}]}' % text.upper().encode()
+            return resp
+
+        mock_post.side_effect = fake_post
+
+        client = GeminiClient(api_key="1234567890ABCDEF")
+        result = client.chat_batch(["a", "b", "c"], max_workers=2)
+
+        self.assertEqual(result, ["A", "B", "C"])
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(client.chat_batch([]), [])
+
+    @patch("requests.Session.post")
+    def test_chat_payload_body(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"candidates": [{"content": {"parts": [{"text": "ok"}]}}]}'
+        mock_post.return_value = mock_response
+
+        client = GeminiClient(api_key="1234567890ABCDEF")
+        prompt = 'Event "4625":\n\tlogon failed \\ caf\u00e9 \u2013 \U0001F600'
+        self.assertEqual(client.chat(prompt), "ok")
+
+        _, kwargs = mock_post.call_args
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+        self.assertEqual(
+            json.loads(kwargs["data"]),
+            {"contents": [{"parts": [{"text": prompt}]}]},
+        )
+
     def test_missing_api_key(self):
         with self.assertRaises(ValueError):
             GeminiClient(api_key=None)
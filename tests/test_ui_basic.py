@@ -87,6 +87,20 @@ class TestUIBasic(unittest.TestCase):
         self.assertIsNotNone(selected2)
         self.assertEqual(selected2["severity"], "warning")
 
+    def test_logs_table_loads_columns(self):
+        table = LogsTable(self.root)
+        table.load_columns(
+            ["2025-01-01 12:00:00", "2025-01-01 12:01:00"],
+            ["High CPU usage", "Disk full"],
+            ["Raw event one", "Raw event two"],
+        )
+        self.assertEqual(len(table.tree.get_children()), 2)
+
+        table.tree.selection_set(table.tree.get_children()[1])
+        selected = table.get_selected()
+        self.assertEqual(selected["raw_event"], "Raw event two")
+        self.assertEqual(selected["severity"], "")
+
 
 if __name__ == "__main__":
     unittest.main()